@@ -47,6 +47,14 @@ class Settings:
         "MINIO_PASSWORD": (None, str),
         "MINIO_SERVER": (None, str),
         "MINIO_BUCKET": (None, str),
+        # Connections kept open to MinIO, enough for every worker thread to have one
+        "MINIO_MAX_POOL_SIZE": (32, int),
+        # Size of the thread pool used for blocking MinIO and image work
+        "WORKER_THREADS": (32, int),
+        # Use collation indexes for case-insensitive lookups (needs MongoDB 3.4+)
+        "USE_COLLATION_INDEX": (True, bool),
+        # Uploaded files up to this many bytes are kept in memory instead of a temp file
+        "UPLOAD_SPOOL_MAX_SIZE": (8 * 1024 * 1024, int),
         # Backup settings
         "BACKUP_DIR": ("backups", str),
         # Email settings
@@ -139,6 +147,10 @@ try:
     MINIO_PASSWORD = settings.MINIO_PASSWORD
     MINIO_SERVER = settings.MINIO_SERVER
     MINIO_BUCKET = settings.MINIO_BUCKET
+    MINIO_MAX_POOL_SIZE = settings.MINIO_MAX_POOL_SIZE
+    WORKER_THREADS = settings.WORKER_THREADS
+    USE_COLLATION_INDEX = settings.USE_COLLATION_INDEX
+    UPLOAD_SPOOL_MAX_SIZE = settings.UPLOAD_SPOOL_MAX_SIZE
     
     # Email Settings
     SMTP_HOST = settings.SMTP_HOST
@@ -13,10 +13,13 @@ from logger.logger import logger
 from .init_db import init_db_indexes
 
 import asyncio
+import os
 from typing import Optional
 
+import certifi
+import urllib3
 from minio import Minio
-from config import MINIO_USERNAME, MINIO_PASSWORD, MINIO_SERVER, MINIO_BUCKET
+from config import MINIO_USERNAME, MINIO_PASSWORD, MINIO_SERVER, MINIO_BUCKET, MINIO_MAX_POOL_SIZE
 
 # Global client with connection pool
 client: Optional[AsyncIOMotorClient] = None
@@ -109,11 +112,24 @@ async def init_object_storage(secure=False):
         server_address = server_address[8:]  # Remove 'https://'
         secure = True
 
+    # Same settings as the SDK's default HTTP client, except for the pool size. The default
+    # keeps 10 connections, so concurrent uploads and backup downloads beyond that
+    # would open a fresh connection for every request
+    timeout = 5 * 60
+    http_client = urllib3.PoolManager(
+        timeout=urllib3.Timeout(connect=timeout, read=timeout),
+        maxsize=MINIO_MAX_POOL_SIZE,
+        cert_reqs='CERT_REQUIRED',
+        ca_certs=os.environ.get('SSL_CERT_FILE') or certifi.where(),
+        retries=urllib3.Retry(total=5, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504])
+    )
+    
     minio_client = Minio(
         MINIO_SERVER,  # MinIO server address
         access_key=MINIO_USERNAME,
         secret_key=MINIO_PASSWORD,
-        secure=secure  # Use False for HTTP, True for HTTPS
+        secure=secure,  # Use False for HTTP, True for HTTPS
+        http_client=http_client
     )
 
     # Create a bucket if it doesn't exist
@@ -1,4 +1,14 @@
-from pymongo import ASCENDING, TEXT
+from pymongo import ASCENDING, DESCENDING, TEXT
+from config import settings
+from models.auth_model import PASSWORD_RESET_CODE_TTL_SECONDS
+from .mongodb import CASE_INSENSITIVE_COLLATION
+
+# (collection, field) pairs looked up case-insensitively, e.g. by /auth/check-availability
+CASE_INSENSITIVE_INDEXES = (
+    ("users", "username"),
+    ("users", "email"),
+    ("categories", "name"),
+)
 
 async def init_db_indexes(db):
     """
@@ -13,6 +23,45 @@ async def init_db_indexes(db):
     
     # Create other indexes if needed
     await db.articles.create_index([("created_at", ASCENDING)])
+    await db.articles.create_index([("created_at", DESCENDING), ("_id", DESCENDING)])
     await db.articles.create_index([("category_id", ASCENDING)])
     await db.articles.create_index([("author_id", ASCENDING)])
-    await db.articles.create_index([("status", ASCENDING)]) 
\ No newline at end of file
+    await db.articles.create_index([("status", ASCENDING)])
+    
+    # Comments are listed per article, and category slugs are checked for uniqueness on every write
+    await db.comments.create_index([("article_id", ASCENDING)])
+    await db.categories.create_index([("slug", ASCENDING)])
+    
+    # Without collation support the prefix-regex fallback needs a plain index instead
+    for collection, field in CASE_INSENSITIVE_INDEXES:
+        if settings.USE_COLLATION_INDEX:
+            await db[collection].create_index(
+                [(field, ASCENDING)],
+                collation=CASE_INSENSITIVE_COLLATION,
+                name=f"{field}_ci"
+            )
+        else:
+            await db[collection].create_index([(field, ASCENDING)])
+    
+    # File IDs are random UUIDs generated by the application, so let the
+    # database reject the (practically impossible) duplicate
+    await db.files.create_index([("file_id", ASCENDING)], unique=True)
+    
+    # Reset codes expire on their own. They are consumed by (email, code) and
+    # replaced by email, which the same index serves through its prefix
+    await db.password_reset_codes.create_index(
+        [("created_at", ASCENDING)],
+        expireAfterSeconds=PASSWORD_RESET_CODE_TTL_SECONDS
+    )
+    await db.password_reset_codes.create_index(
+        [("email", ASCENDING), ("code", ASCENDING)],
+        name="reset_lookup"
+    )
+    # Codes used or replaced back when they were only flagged inactive
+    await db.password_reset_codes.delete_many({"is_active": False})
+    
+    # Lets upload_to_minio find an already converted copy of an uploaded image
+    await db.files.create_index(
+        [("source_hash", ASCENDING), ("folder", ASCENDING)],
+        partialFilterExpression={"source_hash": {"$type": "string"}}
+    ) 
\ No newline at end of file
@@ -1,11 +1,21 @@
 # centralizes MongoDB utilities
 from bson import ObjectId
+from pymongo import WriteConcern
 from typing import Annotated
 from pydantic import Field
 from typing import Dict, Any, Optional
 
 PyObjectId = Annotated[str, Field(default_factory=lambda: str(ObjectId()))]
 
+# Collation for case-insensitive equality matches. Queries only use an index
+# built with the same collation, see CASE_INSENSITIVE_INDEXES in db/init_db.py
+CASE_INSENSITIVE_COLLATION = {"locale": "en", "strength": 2}
+
+# Write concerns for data that is cheap to lose: short-lived records only need the
+# primary's acknowledgement, and advisory fields are not acknowledged at all
+EPHEMERAL_WRITE_CONCERN = WriteConcern(w=1, j=False)
+UNACKNOWLEDGED_WRITE_CONCERN = WriteConcern(w=0)
+
 # Helper functions for MongoDB operations
 def convert_to_object_id(id_value: str) -> ObjectId:
     """Convert string ID to ObjectId for MongoDB queries"""
@@ -43,6 +43,21 @@ class ArticleUpdate(BaseModel):
     is_spotlight: Optional[bool] = None
     is_popular: Optional[bool] = None
 
+class ArticleLikesBulkRequest(BaseModel):
+    """Model for requesting like counts for several articles at once"""
+    article_ids: List[str] = Field(..., max_length=100)
+    include_user: bool = True
+
+class ArticleImagePresignRequest(BaseModel):
+    """Model for requesting a presigned URL to upload an article image directly to storage"""
+    filename: str
+
+class ArticleImageConfirm(BaseModel):
+    """Model for registering an article image that was uploaded through a presigned URL"""
+    file_id: str
+    object_name: str
+    filename: str
+
 class ArticleInDB(ArticleBase):
     """Database representation of an article document"""
     id: PyObjectId = Field(default_factory=lambda: str(ObjectId()), alias="_id")
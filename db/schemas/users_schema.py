@@ -1,3 +1,4 @@
+from functools import cached_property
 from pydantic import BaseModel, Field, EmailStr, field_validator
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -31,6 +32,8 @@ class UserInDB(BaseModel):
     last_login: Optional[datetime] = None
     created_at: datetime = Field(default_factory=get_current_utc_time)
     is_active: bool = True
+    # Bumped whenever the password changes so tokens issued before that stop working
+    token_version: int = 0
 
     model_config = {
         "arbitrary_types_allowed": True,
@@ -40,6 +43,11 @@ class UserInDB(BaseModel):
         }
     }
 
+    @cached_property
+    def id_str(self) -> str:
+        """String form of the user ID, computed once per user object"""
+        return str(self.id)
+
     # NOTE: if you add a new list of IDs, add the field in this field validator
     @field_validator('likes', 'following', 'followers', 'bookmarks', mode='before')
     @classmethod
@@ -1,9 +1,12 @@
 # dependencies/auth.py
 from fastapi import Depends, HTTPException, status
+import hashlib
 import jwt
-from typing import Optional, Annotated
+import time
+from typing import Any, Dict, Optional, Annotated
 from services.auth_service import AuthService
 from dependencies.user import get_user_repository
+from utils.cache import TTLCache
 from utils.security import verify_password
 
 from db.schemas.users_schema import UserInDB
@@ -16,6 +19,24 @@ from config import (
 )
 from models.auth_model import TokenData
 
+# Claims of tokens whose signature has already been verified, keyed by a digest of the token
+verified_token_cache = TTLCache(maxsize=10000, ttl=300)
+
+def decode_token(token: str) -> Dict[str, Any]:
+    """
+    Decode and verify a JWT, reusing the claims of recently verified tokens.
+    Cached tokens only have their expiry checked. Raises jwt.PyJWTError if the token is invalid
+    """
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    payload = verified_token_cache.get(key)
+    if payload is None:
+        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+        verified_token_cache.set(key, payload)
+    elif payload.get("exp", 0) <= time.time():
+        verified_token_cache.invalidate(key)
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    return payload
+
 # Database dependency
 async def get_user(username: str, db: DB) -> Optional[UserInDB]:
     """
@@ -47,7 +68,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: DB = None) -
     )
     
     try:
-        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+        payload = decode_token(token)
         username: str = payload.get("sub")
         user_id: str = payload.get("id")
         user_type: str = payload.get("type")
@@ -61,7 +82,8 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: DB = None) -
         
     user = await get_user(username=token_data.username, db=db)
     
-    if user is None:
+    # Tokens issued before the last password change are revoked
+    if user is None or payload.get("ver", 0) != user.token_version:
         raise credentials_exception
         
     return user
@@ -99,11 +121,13 @@ async def get_current_user_optional(
         return None
     
     try:
-        payload = jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
+        payload = decode_token(token)
         username: str = payload.get("sub")
         if username is None:
             return None
         user = await get_user(username=username, db=db)
+        if user is None or payload.get("ver", 0) != user.token_version:
+            return None
         return user
     except jwt.PyJWTError:
         return None
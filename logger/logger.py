@@ -1,16 +1,28 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 
 # Configure a single application logger
 log_format = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Records are pushed onto a queue by the request handlers and written to
+# stdout by a background listener thread, so log I/O never blocks the event loop
+log_queue = queue.SimpleQueue()
+stream_handler = logging.StreamHandler(sys.stdout)
+stream_handler.setFormatter(logging.Formatter(log_format))
+queue_listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+
 logging.basicConfig(
     level=logging.INFO,
-    format=log_format,
-    handlers=[logging.StreamHandler(sys.stdout)]
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
+queue_listener.start()
+atexit.register(queue_listener.stop)
 
 # Get a single logger for the entire application
 logger = logging.getLogger("app")
 
 # Export only the logger instance
-__all__ = ["logger"]
\ No newline at end of file
+__all__ = ["logger"]
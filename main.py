@@ -1,5 +1,9 @@
 # main.py
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from starlette.formparsers import MultiPartParser
 import uvicorn
 
 from db.db import init_db, close_db_connection, init_object_storage, get_db
@@ -17,8 +21,13 @@ except Exception as e:
     sys.exit(1)
 
 
+# Starlette spools each uploaded file to a temporary file once it passes 1 MiB.
+# Article images are read straight back for WebP conversion and hashing, so keep
+# typical uploads in memory and only spill unusually large ones to disk
+MultiPartParser.spool_max_size = config.UPLOAD_SPOOL_MAX_SIZE
+
 # Initialize FastAPI app
-app = FastAPI(title="Content Management System API")
+app = FastAPI(title="Content Management System API", default_response_class=ORJSONResponse)
 
 # Setup routes
 setup_routes(app)
@@ -28,6 +37,11 @@ setup_routes(app)
 async def startup_db_client():
     # Validation can be done here too if needed
     logger.info("Starting up application")
+    # Blocking MinIO and image work is offloaded with asyncio.to_thread, which
+    # uses the loop's default executor
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=config.WORKER_THREADS, thread_name_prefix="worker")
+    )
     await init_db()
     await init_object_storage()
     
@@ -3,7 +3,7 @@ from db.schemas.comments_schema import CommentInDB
 from typing import Dict, Any, Optional
 from db.mongodb import convert_to_object_id
 from models.models import prepare_mongo_document, clean_document
-from datetime import datetime
+from utils.time import get_current_utc_time
 
 
 def comment_db_to_response(comment_db: CommentInDB) -> CommentResponse:
@@ -21,7 +21,7 @@ def comment_db_to_response(comment_db: CommentInDB) -> CommentResponse:
         "user_first_name": comment_dict.get("user_first_name", "Unknown"),
         "user_last_name": comment_dict.get("user_last_name", "User"),
         "user_type": comment_dict.get("user_type", "normal"),
-        "created_at": comment_dict.get("created_at", datetime.utcnow()),
+        "created_at": comment_dict.get("created_at", get_current_utc_time()),
         "updated_at": comment_dict.get("updated_at")
     }
     
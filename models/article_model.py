@@ -1,7 +1,9 @@
+import asyncio
 from typing import Dict, Union
 from bson import ObjectId
 from fastapi import HTTPException
 from models.users_model import get_author_data
+from logger.logger import logger
 
 
 async def get_category_data(db, category_id: Union[str, ObjectId]) -> Dict:
@@ -14,70 +16,78 @@ async def get_category_data(db, category_id: Union[str, ObjectId]) -> Dict:
             return await db.categories.find_one({"_id": category_id})
         return None
     except Exception as e:
-        print(f"Error in get_category_data: {str(e)}")
+        logger.error("Error in get_category_data: %s", e)
         return None
 
 # TODO: can refactor and remove this
 async def enrich_article_data(db, article: Dict) -> Dict:
     """Add related data to an article."""
     try:
-        print(f"Starting article enrichment for article: {article.get('_id')}")
-        print(f"Full article data: {article}")
+        logger.debug("Starting article enrichment for article: %s", article.get("_id"))
+        logger.debug("Full article data: %s", article)
         
         # Get the related category
-        category_data = None
-        if "category_id" in article and article["category_id"]:
-            print(f"Found category_id: {article['category_id']}")
-            try:
-                category_data = await get_category_data(db, article["category_id"])
-                print(f"Retrieved category data: {category_data}")
-            except Exception as e:
-                print(f"Error retrieving category data: {str(e)}")
-                category_data = None
-        else:
-            print("No category_id found in article")
+        async def load_category():
+            if "category_id" in article and article["category_id"]:
+                logger.debug("Found category_id: %s", article["category_id"])
+                try:
+                    category_data = await get_category_data(db, article["category_id"])
+                    logger.debug("Retrieved category data: %s", category_data)
+                    return category_data
+                except Exception as e:
+                    logger.error("Error retrieving category data: %s", e)
+            else:
+                logger.debug("No category_id found in article")
+            return None
         
         # Get the related author
-        author_data = None
-        if "author_id" in article and article["author_id"]:
-            print(f"Found author_id: {article['author_id']}")
-            try:
-                # Convert author_id to ObjectId if it's a string
-                author_id = article["author_id"]
-                if isinstance(author_id, str):
-                    author_id = ObjectId(author_id)
-                author_data = await get_author_data(db, author_id)
-                print(f"Retrieved author data: {author_data}")
-            except Exception as e:
-                print(f"Error retrieving author data: {str(e)}")
-                print(f"Author ID that caused the error: {article['author_id']}")
-                print(f"Author ID type: {type(article['author_id'])}")
-                author_data = None
-        else:
-            print("No author_id found in article")
+        async def load_author():
+            if "author_id" in article and article["author_id"]:
+                logger.debug("Found author_id: %s", article["author_id"])
+                try:
+                    # Convert author_id to ObjectId if it's a string
+                    author_id = article["author_id"]
+                    if isinstance(author_id, str):
+                        author_id = ObjectId(author_id)
+                    author_data = await get_author_data(db, author_id)
+                    logger.debug("Retrieved author data: %s", author_data)
+                    return author_data
+                except Exception as e:
+                    logger.error(
+                        "Error retrieving author data: %s (author ID %r of type %s)",
+                        e, article["author_id"], type(article["author_id"]).__name__
+                    )
+            else:
+                logger.debug("No author_id found in article")
+            return None
 
         # Handle file data if present
-        main_image_file = None
-        if "image_id" in article and article["image_id"]:
-            print(f"Found image_id: {article['image_id']}")
-            try:
-                file_dict = await db.files.find_one({"file_id": article["image_id"]})
-                if file_dict:
-                    main_image_file = {
-                        "file_id": file_dict.get("file_id"),
-                        "file_type": file_dict.get("file_type"),
-                        "file_extension": file_dict.get("file_extension"),
-                        "size": file_dict.get("size"),
-                        "object_name": file_dict.get("object_name"),
-                        "slug": file_dict.get("slug"),
-                        "unique_string": file_dict.get("unique_string")
-                    }
-                    print(f"Retrieved file data: {main_image_file}")
-                else:
-                    print(f"No file found for image_id: {article['image_id']}")
-            except Exception as e:
-                print(f"Error retrieving file data: {str(e)}")
-                main_image_file = None
+        async def load_main_image_file():
+            if "image_id" in article and article["image_id"]:
+                logger.debug("Found image_id: %s", article["image_id"])
+                try:
+                    file_dict = await db.files.find_one({"file_id": article["image_id"]})
+                    if file_dict:
+                        main_image_file = {
+                            "file_id": file_dict.get("file_id"),
+                            "file_type": file_dict.get("file_type"),
+                            "file_extension": file_dict.get("file_extension"),
+                            "size": file_dict.get("size"),
+                            "object_name": file_dict.get("object_name"),
+                            "slug": file_dict.get("slug"),
+                            "unique_string": file_dict.get("unique_string")
+                        }
+                        logger.debug("Retrieved file data: %s", main_image_file)
+                        return main_image_file
+                    logger.debug("No file found for image_id: %s", article["image_id"])
+                except Exception as e:
+                    logger.error("Error retrieving file data: %s", e)
+            return None
+
+        # The three lookups are independent, so fetch them concurrently
+        category_data, author_data, main_image_file = await asyncio.gather(
+            load_category(), load_author(), load_main_image_file()
+        )
 
         # Build response with safe dictionary access
         enriched_article = {
@@ -87,12 +97,12 @@ async def enrich_article_data(db, article: Dict) -> Dict:
             "main_image_file": main_image_file if main_image_file else None,
             "image": "DEPRECIATED"  # Mark the old image field as deprecated
         }
-        print(f"Successfully enriched article: {enriched_article.get('_id')}")
+        logger.debug("Successfully enriched article: %s", enriched_article.get("_id"))
         return enriched_article
         
     except Exception as e:
-        print(f"Error in enrich_article_data: {str(e)}")
-        print(f"Article data at time of error: {article}")
+        logger.error("Error in enrich_article_data: %s", e)
+        logger.debug("Article data at time of error: %s", article)
         raise Exception(f"Error enriching article: {str(e)}")
 
 async def get_article(db, article_id: str) -> dict:
@@ -3,6 +3,9 @@ from pydantic import BaseModel, EmailStr
 from datetime import datetime
 from db.schemas.files_schema import FileInDB
 
+# Password reset codes are valid for 15 minutes, after which a TTL index removes them
+PASSWORD_RESET_CODE_TTL_SECONDS = 15 * 60
+
 class Token(BaseModel):
     access_token: str
     profile_picture_base64: str = None
@@ -13,6 +16,7 @@ class TokenData(BaseModel):
     username: Optional[str] = None
     user_id: Optional[str] = None
     user_type: Optional[str] = None
+    token_version: int = 0
 
 class PasswordResetRequest(BaseModel):
     """Model for requesting a password reset"""
@@ -25,8 +29,7 @@ class PasswordReset(BaseModel):
     new_password: str
 
 class PasswordResetCode(BaseModel):
-    """Model for storing password reset codes in database"""
+    """Model for storing password reset codes in database, a code is active for as long as it exists"""
     email: EmailStr
     code: str
-    created_at: datetime
-    is_active: bool = True
\ No newline at end of file
+    created_at: datetime
\ No newline at end of file
@@ -140,7 +140,7 @@ class AdminDetails(BaseModel):
     }
 
 class NormalUserDetails(BaseModel):
-    signup_date: datetime = Field(default_factory=datetime.utcnow)
+    signup_date: datetime = Field(default_factory=get_current_utc_time)
     email_notifications: bool = True
     reading_preferences: List[str] = []
 
@@ -240,7 +240,7 @@ class ArticleInDB(ArticleBase):
     images: List[ArticleImage] = []
     published_at: Optional[datetime] = None
     comments: List[Dict[str, Any]] = []
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=get_current_utc_time)
     updated_at: Optional[datetime] = None
     status: ArticleStatus
     bookmarked_by: List[PyObjectId] = []
@@ -290,7 +290,7 @@ class MessageInDB(BaseModel):
     recipient_id: PyObjectId
     text: str
     read: bool = False
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=get_current_utc_time)
 
     model_config = {
         "arbitrary_types_allowed": True
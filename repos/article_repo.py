@@ -1,10 +1,13 @@
+import asyncio
 from fastapi import HTTPException
-from typing import Dict, Any, Optional, List
+from datetime import datetime
+from typing import AsyncIterator, Dict, Any, Optional, List, Tuple
 from bson import ObjectId
 from pymongo import ReturnDocument
 from utils.time import get_current_utc_time 
 from models.models import ArticleStatus, clean_document, ensure_object_id, prepare_mongo_document
 from models.article_model import enrich_article_data
+from utils.pagination import keyset_filter
 
 class ArticleRepository:
     """
@@ -56,14 +59,21 @@ class ArticleRepository:
         
         return is_liked, like_count
     
-    async def create_article(self, article_dict: Dict[str, Any]) -> Dict[str, Any]:
+    async def create_article(self, article_dict: Dict[str, Any], file_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
             """
-            Create a new article
+            Create a new article, along with the metadata of its image file if given
             Returns the created article
             """
             try:
-                # Insert article into database
-                result = await self.db.articles.insert_one(article_dict)
+                # Insert article into database. The article only references the file by
+                # its file_id, so both documents can be written at the same time
+                if file_data is not None:
+                    _, result = await asyncio.gather(
+                        self.db.files.insert_one(file_data),
+                        self.db.articles.insert_one(article_dict)
+                    )
+                else:
+                    result = await self.db.articles.insert_one(article_dict)
                 
                 # Get the created article
                 created_article = await self.db.articles.find_one({"_id": result.inserted_id})
@@ -282,11 +292,21 @@ class ArticleRepository:
         Get a list of articles based on query
         Returns a list of enriched articles
         """
+        return [article async for article in self.iter_articles(query, skip, limit, current_user)]
+
+    async def iter_articles(self, query: Dict[str, Any], skip: int = 0, limit: int = 20, current_user=None, after: Optional[Tuple[datetime, ObjectId]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over articles matching query as the cursor yields them
+        If after is a (created_at, _id) cursor, only articles following it are returned
+        Each article is enriched and cleaned before being yielded
+        """
         try:
-            # Fetch articles
-            cursor = self.db.articles.find(query).sort("created_at", -1).skip(skip).limit(limit)
+            if after is not None:
+                query = {"$and": [query, keyset_filter(*after)]}
+            
+            # Fetch articles, newest first with _id as a tie-breaker so cursors are stable
+            cursor = self.db.articles.find(query).sort([("created_at", -1), ("_id", -1)]).skip(skip).limit(limit)
             
-            articles = []
             async for article in cursor:
                 # Add is_bookmarked field if current_user is valid
                 article["is_bookmarked"] = self.check_if_bookmarked(article, current_user)
@@ -314,9 +334,7 @@ class ArticleRepository:
                 
                 # Enrich article with related data
                 enriched_article = await enrich_article_data(self.db, article)
-                articles.append(prepare_mongo_document(enriched_article))
-            
-            return clean_document(articles)
+                yield clean_document(prepare_mongo_document(enriched_article))
         except Exception as e:
             raise Exception(f"Error getting articles: {str(e)}")
 
@@ -357,7 +375,7 @@ class ArticleRepository:
         Returns a list of enriched articles
         """
         try:
-            cursor = self.db.articles.find(query).sort(sort_field, -1).limit(limit)
+            cursor = self.db.articles.find(query).sort([(sort_field, -1), ("_id", -1)]).limit(limit)
             
             articles = []
             async for article in cursor:
@@ -491,13 +509,13 @@ class ArticleRepository:
             article_object_id = ensure_object_id(article_id)
             user_object_id = ensure_object_id(user_id)
             
-            # Check if article exists
-            article = await self.db.articles.find_one({"_id": article_object_id})
+            # Fetch the article and the user together, with only the like lists
+            article, user = await asyncio.gather(
+                self.db.articles.find_one({"_id": article_object_id}, {"liked_by": 1}),
+                self.db.users.find_one({"_id": user_object_id}, {"likes": 1})
+            )
             if not article:
                 raise ValueError("Article not found")
-            
-            # Get the user
-            user = await self.db.users.find_one({"_id": user_object_id})
             if not user:
                 raise ValueError("User not found")
             
@@ -514,16 +532,16 @@ class ArticleRepository:
             already_in_liked_by = user_object_id in article_liked_by_ids
             
             if not already_in_likes and not already_in_liked_by:
-                # Update user's likes list
-                user_result = await self.db.users.update_one(
-                    {"_id": user_object_id},
-                    {"$addToSet": {"likes": article_object_id}}
-                )
-                
-                # Update the article's liked_by list
-                article_result = await self.db.articles.update_one(
-                    {"_id": article_object_id},
-                    {"$addToSet": {"liked_by": user_object_id}}
+                # Update the user's likes list and the article's liked_by list at the same time
+                user_result, article_result = await asyncio.gather(
+                    self.db.users.update_one(
+                        {"_id": user_object_id},
+                        {"$addToSet": {"likes": article_object_id}}
+                    ),
+                    self.db.articles.update_one(
+                        {"_id": article_object_id},
+                        {"$addToSet": {"liked_by": user_object_id}}
+                    )
                 )
                 
                 if user_result.modified_count and article_result.modified_count:
@@ -572,23 +590,23 @@ class ArticleRepository:
             article_object_id = ensure_object_id(article_id)
             
             # Check if article exists
-            article = await self.db.articles.find_one({"_id": article_object_id})
+            article = await self.db.articles.find_one({"_id": article_object_id}, {"_id": 1})
             if not article:
                 raise ValueError("Article not found")
             
             # Get the user
             user_object_id = ensure_object_id(user_id)
             
-            # Remove article from user's likes list
-            user_result = await self.db.users.update_one(
-                {"_id": user_object_id},
-                {"$pull": {"likes": article_object_id}}
-            )
-            
-            # Remove user from article's liked_by list
-            article_result = await self.db.articles.update_one(
-                {"_id": article_object_id},
-                {"$pull": {"liked_by": user_object_id}}
+            # Remove the article from the user's likes and the user from the article's liked_by list
+            user_result, article_result = await asyncio.gather(
+                self.db.users.update_one(
+                    {"_id": user_object_id},
+                    {"$pull": {"likes": article_object_id}}
+                ),
+                self.db.articles.update_one(
+                    {"_id": article_object_id},
+                    {"$pull": {"liked_by": user_object_id}}
+                )
             )
             
             # Check results and return appropriate response
@@ -630,6 +648,38 @@ class ArticleRepository:
         except Exception as e:
             raise Exception(f"Error getting article likes count: {str(e)}")
         
+    async def get_articles_likes_bulk(self, article_ids: List[str], user_id: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get like counts for several articles in a single aggregation
+        When user_id is given, also report whether that user liked each article
+        Returns a dict keyed by article ID with "count" and "is_liked" entries
+        """
+        try:
+            # Convert IDs to ObjectId
+            article_object_ids = [ensure_object_id(article_id) for article_id in article_ids]
+            user_object_id = ensure_object_id(user_id) if user_id else None
+            
+            liked_by = {"$ifNull": ["$liked_by", []]}
+            pipeline = [
+                {"$match": {"_id": {"$in": article_object_ids}}},
+                {"$project": {
+                    "_id": 1,
+                    "count": {"$size": liked_by},
+                    "is_liked": {"$in": [user_object_id, liked_by]} if user_object_id else {"$literal": False}
+                }}
+            ]
+            
+            # Articles that don't exist are reported with zero likes
+            likes = {article_id: {"count": 0, "is_liked": False} for article_id in article_ids}
+            async for doc in self.db.articles.aggregate(pipeline):
+                likes[str(doc["_id"])] = {"count": doc["count"], "is_liked": doc["is_liked"]}
+            
+            return likes
+        except ValueError as e:
+            raise e
+        except Exception as e:
+            raise Exception(f"Error getting article likes in bulk: {str(e)}")
+        
     async def get_article_likes_users(self, article_id: str) -> List[Dict[str, str]]:
         """
         Get the list of users who liked an article with their details
@@ -681,22 +731,18 @@ class ArticleRepository:
         except Exception as e:
             raise Exception(f"Error getting users who liked the article: {str(e)}")        
                 
-    async def upload_article_image(self, article_id: str, file_path: str, is_main: bool, is_thumbnail: bool, caption: Optional[str]) -> Dict[str, Any]:
+    async def upload_article_images(self, article_id: str, images: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
-        Add an image to an article
+        Add one or more images to an article in a single update
+        Each image is a dict with url, is_main, is_thumbnail and caption keys
         Returns the updated article
         """
         try:
             # Convert article_id to ObjectId
             article_object_id = ObjectId(article_id)
             
-            # Create image object
-            image = {
-                "url": file_path,
-                "is_main": is_main,
-                "is_thumbnail": is_thumbnail,
-                "caption": caption
-            }
+            is_main = any(image.get("is_main") for image in images)
+            is_thumbnail = any(image.get("is_thumbnail") for image in images)
             
             # If setting as main or thumbnail, unset others
             if is_main:
@@ -711,10 +757,10 @@ class ArticleRepository:
                     {"$set": {"images.$.is_thumbnail": False}}
                 )
             
-            # Add image to article
+            # Add the images to the article
             updated_article = await self.db.articles.find_one_and_update(
                 {"_id": article_object_id},
-                {"$push": {"images": image}},
+                {"$push": {"images": {"$each": images}}},
                 return_document=ReturnDocument.AFTER
             )
             
@@ -89,26 +89,31 @@ class CommentRepository:
         except Exception as e:
             raise Exception(f"Error in get_comment_from_article: {str(e)}")
 
-    async def update_comment(self, comment_id: str, update_data: Dict[str, Any]) -> Any | None:
+    async def update_comment(self, comment_id: str, update_data: Dict[str, Any], user_id: Optional[ObjectId] = None) -> Any | None:
         """
        Update a comment in comments collection
-       Returns True if successful, False otherwise
+       If user_id is given only a comment written by that user is updated
+       Returns the updated comment, None if no comment matched
        """
         try:
             comment_object_id = ObjectId(comment_id)
+            comment_filter = {"_id": comment_object_id}
+            if user_id is not None:
+                # Check ownership in the same round-trip as the update
+                comment_filter["user_id"] = user_id
             update_result = await self.db.comments.find_one_and_update(
-                    {"_id": comment_object_id},
+                    comment_filter,
                     {"$set": update_data},
                     return_document=True
                     )
             if not update_result:
                     return None
 
-                    # Convert ObjectId to string for the response
+            # Convert ObjectId to string for the response
             if isinstance(update_result.get("_id"), ObjectId):
                 update_result["_id"] = str(update_result["_id"])
 
-                return update_result
+            return update_result
             
         except Exception as e:
             raise Exception(f"Error in update_comment_in_article: {str(e)}")
@@ -163,28 +168,24 @@ class CommentRepository:
             raise Exception(f"Error in delete_comment_from_article: {str(e)}")
 
 
-    async def soft_delete_comment(self,comment_id: str) -> bool:
+    async def soft_delete_comment(self, comment_id: str, user_id: Optional[ObjectId] = None) -> Any | None:
         """
             Delete a comment from comments collections
-            Returns True if successful, False otherwise
+            If user_id is given only a comment written by that user is deleted
+            Returns the deleted comment, None if no comment matched
         """
         try:
             
             # Convert IDs to ObjectId
             comment_object_id = ObjectId(comment_id)
+            comment_filter = {"_id": comment_object_id}
+            if user_id is not None:
+                # Check ownership in the same round-trip as the update
+                comment_filter["user_id"] = user_id
             
-            # Get the comment to find its article_id
-            comment = await self.db.comments.find_one({"_id": comment_object_id})
-            if comment and "article_id" in comment:
-                # Remove the comment ID from the article's comments array
-                await self.db.articles.update_one(
-                    {"_id": comment["article_id"]},
-                    {"$pull": {"comments": comment_object_id}}
-                )
-            
-            # Update the comment with deleted_at timestamp
+            # Update the comment with deleted_at timestamp, which also returns its article_id
             result = await self.db.comments.find_one_and_update(
-            {"_id": comment_object_id},
+            comment_filter,
             {
                 "$set": {
                     "deleted_at": datetime.now(timezone.utc)
@@ -192,6 +193,12 @@ class CommentRepository:
             },
             return_document=True
         )
+            if result and "article_id" in result:
+                # Remove the comment ID from the article's comments array
+                await self.db.articles.update_one(
+                    {"_id": result["article_id"]},
+                    {"$pull": {"comments": comment_object_id}}
+                )
 
             return result
         except Exception as e:
@@ -1,5 +1,5 @@
 from typing import List, Optional
-from datetime import datetime
+from utils.time import get_current_utc_time
 from bson import ObjectId
 from models.message_model import MessageCreate, MessageResponse, Conversation
 
@@ -12,7 +12,7 @@ class MessageRepository:
     async def create_message(self, message: MessageCreate) -> MessageResponse:
         """Create a new message and update conversation"""
         message_dict = message.model_dump()
-        message_dict["created_at"] = datetime.utcnow()
+        message_dict["created_at"] = get_current_utc_time()
         message_dict["is_read"] = False
         
         # Insert message
@@ -31,7 +31,7 @@ class MessageRepository:
                 {
                     "$set": {
                         "last_message": message_dict,
-                        "updated_at": datetime.utcnow()
+                        "updated_at": get_current_utc_time()
                     },
                     "$inc": {"unread_count": 1}
                 }
@@ -41,7 +41,7 @@ class MessageRepository:
                 "participants": participants,
                 "last_message": message_dict,
                 "unread_count": 1,
-                "updated_at": datetime.utcnow()
+                "updated_at": get_current_utc_time()
             })
         
         return MessageResponse(**message_dict)
@@ -86,7 +86,7 @@ class MessageRepository:
             {
                 "$set": {
                     "is_read": True,
-                    "read_at": datetime.utcnow()
+                    "read_at": get_current_utc_time()
                 }
             }
         )
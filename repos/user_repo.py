@@ -1,11 +1,12 @@
 from fastapi import HTTPException
+from datetime import datetime
 from typing import Dict, List, Optional, Any
 from bson import ObjectId
 from pymongo import ReturnDocument
 
 from db.schemas.users_schema import UserInDB
 from models.models import clean_document, ensure_object_id, prepare_mongo_document
-from db.mongodb import convert_to_object_id, overwrite_mongodb_id
+from db.mongodb import convert_to_object_id, overwrite_mongodb_id, UNACKNOWLEDGED_WRITE_CONCERN
 
 # Refactor the schemas
 class UserRepository:
@@ -420,9 +421,13 @@ class UserRepository:
         Returns UserInDB model or None
         """
         try:
+            update = {"$set": update_data}
+            # A new password revokes every token issued with the old one
+            if "password_hash" in update_data:
+                update["$inc"] = {"token_version": 1}
             updated_user = await self.db.users.find_one_and_update(
                 {"_id": ensure_object_id(user_id)},
-                {"$set": update_data},
+                update,
                 return_document=ReturnDocument.AFTER
             )
             
@@ -701,7 +706,7 @@ class UserRepository:
         """
         try:
             # Get the current user's document
-            user = await self.db.users.find_one({"_id": ObjectId(str(current_user.id))})
+            user = await self.db.users.find_one({"_id": ObjectId(current_user.id_str)})
             if not user:
                 return []
 
@@ -737,6 +742,22 @@ class UserRepository:
             print(f"Error in get_following: {str(e)}")
             raise Exception(f"Failed to get following users: {str(e)}")
     
+    async def get_following_ids(self, user_id: str) -> List[ObjectId]:
+        """
+        Get the ObjectIds of the users that a user follows, without loading their profiles
+        """
+        user = await self.db.users.find_one(
+            {"_id": ensure_object_id(user_id)},
+            {"following": 1}
+        )
+        if not user:
+            return []
+        # follow_author stores ObjectIds, so only legacy string entries need parsing
+        return [
+            _id if isinstance(_id, ObjectId) else ensure_object_id(str(_id))
+            for _id in user.get("following", [])
+        ]
+    
     async def get_user_statistics(self, user_identifier: str, current_user: Optional[UserInDB]) -> Dict[str, Any]:
         """Get comprehensive statistics for a user"""
         try:
@@ -799,7 +820,7 @@ class UserRepository:
                     # Check if current user is following this follower
                     is_following_follower = False
                     if current_user:
-                        current_user_object_id = ObjectId(str(current_user.id))
+                        current_user_object_id = ObjectId(current_user.id_str)
                         is_following_follower = current_user_object_id in [
                             ObjectId(str(f_id)) if not isinstance(f_id, ObjectId) else f_id 
                             for f_id in follower.get("followers", [])
@@ -844,7 +865,7 @@ class UserRepository:
                     # Check if current user is following this user
                     is_following_user = False
                     if current_user:
-                        current_user_object_id = ObjectId(str(current_user.id))
+                        current_user_object_id = ObjectId(current_user.id_str)
                         is_following_user = current_user_object_id in [
                             ObjectId(str(f_id)) if not isinstance(f_id, ObjectId) else f_id 
                             for f_id in following_user.get("followers", [])
@@ -929,9 +950,9 @@ class UserRepository:
             
             # Check if current user is following this user
             is_following = False
-            if current_user and str(current_user.id) != str(user["_id"]):
+            if current_user and current_user.id_str != str(user["_id"]):
                 # Only perform this check if a current_user is provided and not viewing own profile
-                current_user_object_id = ObjectId(str(current_user.id))
+                current_user_object_id = ObjectId(current_user.id_str)
                 is_following = current_user_object_id in [ObjectId(str(f_id)) for f_id in follower_ids]
             
             # If user has a profile photo, fetch the file details
@@ -1224,6 +1245,20 @@ class UserRepository:
         except Exception as e:
             raise Exception(f"Error getting bookmarks: {str(e)}")
         
+    async def set_last_login(self, user_id: str, last_login: datetime) -> None:
+        """
+        Record a user's last login time without reading the document back.
+        The timestamp is advisory, so the write is not acknowledged
+        """
+        try:
+            users = self.db.users.with_options(write_concern=UNACKNOWLEDGED_WRITE_CONCERN)
+            await users.update_one(
+                {"_id": ensure_object_id(user_id)},
+                {"$set": {"last_login": last_login}}
+            )
+        except Exception as e:
+            raise Exception(f"Error updating last login: {str(e)}")
+
     async def decrement_author_articles_count(self, author_id: ObjectId) -> None:
         """
         Decrement an author's article count
@@ -1,22 +1,83 @@
+import asyncio
 import os
-import uuid
-import json
-from fastapi import APIRouter, Body, Depends, File, Form, HTTPException, Response, status, UploadFile, Request
-from typing import Any, Dict, List, Optional
-
-from fastapi.responses import JSONResponse
-from db.db import get_object_storage
-from models.models import ArticleStatus, clean_document, get_current_utc_time
-from db.schemas.articles_schema import ArticleCreate, ArticleUpdate
+import orjson
+from fastapi import APIRouter, Body, Depends, File, Form, HTTPException, Query, Response, status, UploadFile, Request
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from db.db import get_db, get_object_storage
+from models.models import ArticleStatus, get_current_utc_time
+from db.schemas.articles_schema import ArticleCreate, ArticleImageConfirm, ArticleImagePresignRequest, ArticleLikesBulkRequest, ArticleUpdate
 from dependencies.article import ArticleServiceDep
 from dependencies.auth import CurrentActiveUser, AdminUser, OptionalUser, get_current_user_optional, get_current_active_user
 from dependencies.user import UserServiceDep
+from services.minio_service import create_presigned_upload, create_slug, describe_uploaded_object, upload_to_minio
+from logger.logger import logger
+from utils.cache import TTLCache, etag_matches, make_etag
+from utils.pagination import keyset_filter, parse_cursor
+from utils.serialization import MongoJSONResponse, dumps
 # from dependencies.minio import Minio
 from minio import Minio
 from bson import ObjectId
 
 router = APIRouter()
 
+# Short-lived cache of (ETag, serialized body) home page payloads, keyed by user id (None for anonymous)
+home_page_cache = TTLCache(maxsize=1024, ttl=30)
+
+# Serialized anonymous article responses, keyed by article id and stored alongside the
+# version they were built from: (updated_at, likes, bookmarks, comments, images, category, author, main image)
+article_response_cache = TTLCache(maxsize=1024, ttl=300)
+
+# Status value matched by the feed queries
+PUBLISHED_STATUS = ArticleStatus.published.value
+
+# Form fields accepted by update_article, in the order they are passed to ArticleUpdate
+ARTICLE_UPDATE_FIELDS = (
+    "name", "content", "excerpt", "category_id", "read_time",
+    "status", "tags", "is_spotlight", "is_popular"
+)
+
+def invalidate_article_caches(article_id: Optional[str] = None) -> None:
+    """
+    Drop cached responses after an article changes, or after data embedded in
+    many articles (such as a category) changes when no article_id is given.
+    The home page mixes many articles, so every home page entry is dropped
+    rather than tracking which articles each one contains
+    """
+    if article_id is None:
+        article_response_cache.invalidate()
+    else:
+        article_response_cache.invalidate(article_id)
+    home_page_cache.invalidate()
+
+def get_page_cursor(after: Optional[str]):
+    """Parse the after query parameter into a (created_at, _id) cursor, rejecting malformed values"""
+    if after is None:
+        return None
+    try:
+        return parse_cursor(after)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor, expected after=<created_at>,<id>"
+        )
+
+async def stream_json_array(first: Any, items: AsyncIterator[Any]) -> AsyncIterator[bytes]:
+    """
+    Serialize first and the rest of an async iterator as a JSON array, one element at a time.
+    The caller fetches first itself, so failures before anything is sent still become an error response
+    """
+    try:
+        yield b"[" + orjson.dumps(first)
+        async for item in items:
+            yield b"," + orjson.dumps(item)
+        yield b"]"
+    except Exception:
+        # The status line is already sent, so all that can be done is to log and abort the body
+        logger.exception("Failed while streaming a JSON array response")
+        raise
+
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def create_article(
     name: str = Form(...),
@@ -36,52 +97,39 @@ async def create_article(
     The category_id and author_id are converted from string to ObjectId.
     """
     try:
-        print(f"[Create Article] Starting article creation for user_id: {current_user.id}")
+        logger.debug("[Create Article] Starting article creation for user_id: %s", current_user.id)
         
         # Initialize image-related fields
+        file_data = None
         image_file = None
         image_id = None
         image_url = None
         main_image_file = None
         
-        # Handle image upload if provided
-        if image and image.filename:
+        # Handle image upload if provided (a zero-byte upload is treated as no image)
+        if image and image.filename and (image.size or 0) > 0:
             try:
-                print(f"[Create Article] Processing image upload: {image.filename}")
-                
-                # Get MongoDB collection for file metadata
-                from db.db import get_db
-                mongo_collection = await get_db()
-                mongo_collection = mongo_collection.files
-                print(f"[Create Article] MongoDB collection retrieved: files")
-                
-                # Generate a unique file ID
-                from services.minio_service import generate_unique_file_id
-                file_id = await generate_unique_file_id(mongo_collection)
-                print(f"[Create Article] Generated file_id: {file_id}")
+                logger.debug("[Create Article] Processing image upload: %s", image.filename)
                 
                 # Organize by user_id/article_id/files
-                folder = f"{current_user.id}/articles"
-                print(f"[Create Article] Storage folder path: {folder}")
+                folder = f"{current_user.id_str}/articles"
+                logger.debug("[Create Article] Storage folder path: %s", folder)
                 
-                # Save the image to MinIO
-                from services.minio_service import upload_to_minio
+                # Save the image to MinIO. upload_to_minio assigns a random UUID file_id,
+                # and the unique index on files.file_id guards against collisions
                 file_data = await upload_to_minio(
-                    data=await image.read(),
+                    data=image.file,
                     filename=image.filename,
                     content_type=image.content_type,
                     minio_client=minio_client,
                     folder=folder
                 )
-                print(f"[Create Article] Image saved to MinIO: {file_data['object_name']}")
+                file_id = file_data["file_id"]
+                logger.debug("[Create Article] Image saved to MinIO: %s", file_data["object_name"])
                 
-                # Store file metadata in MongoDB with additional user_id
-                file_data["user_id"] = str(current_user.id)
-                print(f"[Create Article] File data: {file_data}")
-                # Save to database
-                result = await mongo_collection.insert_one(file_data)
-                print(f"[Create Article] File metadata stored in MongoDB: {result.inserted_id}")
-                file_id = file_data.get("file_id")
+                # File metadata is stored in MongoDB with the article, with additional user_id
+                file_data["user_id"] = current_user.id_str
+                logger.debug("[Create Article] File data: %s", file_data)
                 
                 # Set the image-related fields
                 image_file = file_id
@@ -96,11 +144,11 @@ async def create_article(
                     "size": file_data["size"],
                     "object_name": file_data["object_name"],
                     "slug": file_data["slug"],
-                    "unique_string": file_data["file_id"].split("-")[0]  # First part of UUID
+                    "unique_string": file_data["unique_string"]  # First part of UUID, set by upload_to_minio
                 }
                 
             except Exception as e:
-                print(f"[Create Article] Error processing image: {str(e)}")
+                logger.exception("[Create Article] Error processing image")
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail=f"Error processing image: {str(e)}"
@@ -108,7 +156,7 @@ async def create_article(
             finally:
                 await image.close()
         else:
-            print("[Create Article] No image provided with the article")
+            logger.debug("[Create Article] No image provided with the article")
         
         # Create article document
         article_doc = ArticleCreate(
@@ -126,8 +174,8 @@ async def create_article(
         )
         
         # Create the article using the service
-        created_article = await article_service.create_article(article_doc, str(current_user.id))
-        print(f"[Create Article] Article created successfully")
+        created_article = await article_service.create_article(article_doc, current_user.id_str, file_data)
+        logger.debug("[Create Article] Article created successfully")
         
         # Add the main_image_file to the response if it exists
         if main_image_file:
@@ -136,10 +184,10 @@ async def create_article(
         return created_article
         
     except HTTPException as e:
-        print(f"[Create Article] HTTP Exception: {str(e)}")
+        logger.debug("[Create Article] HTTP Exception: %s", e)
         raise e
     except Exception as e:
-        print(f"[Create Article] Unexpected error: {str(e)}")
+        logger.exception("[Create Article] Unexpected error")
         raise HTTPException(status_code=500, detail=f"Server error: {str(e)}")
 
 
@@ -150,21 +198,34 @@ async def read_articles(
     tag: Optional[str] = None,
     featured: Optional[bool] = None,
     article_status: Optional[ArticleStatus] = None,
-    skip: int = 0,
+    skip: int = Query(0, deprecated=True),
     limit: int = 20,
+    after: Optional[str] = None,
     current_user: OptionalUser = None,
     article_service: ArticleServiceDep = None
 ):
-    """Get a list of articles with optional filtering"""
+    """
+    Get a list of articles with optional filtering.
+    Pass after=<created_at>,<id> of the last article of the previous page to get the next page;
+    skip is still accepted but gets slower the deeper the page.
+    """
+    cursor = get_page_cursor(after)
     try:
         # If no status is specified, default to showing published articles
         if article_status is None:
             article_status = ArticleStatus.published
             
-        articles = await article_service.get_articles(
-            category, author, tag, featured, article_status, skip, limit
+        articles = await article_service.stream_articles(
+            category, author, tag, featured, article_status, skip, limit, cursor
         )
-        return JSONResponse(content=articles)
+        if articles is None:
+            return ORJSONResponse(content=[])
+        # Run the query and enrich the first article before the response starts,
+        # so a failure there is still reported as a 500 instead of a truncated body
+        first = await anext(articles, None)
+        if first is None:
+            return ORJSONResponse(content=[])
+        return StreamingResponse(stream_json_array(first, articles), media_type="application/json")
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -175,6 +236,7 @@ async def read_articles(
 @router.get("/{id_or_slug}", response_model=Dict[str, Any])
 async def read_article(
     id_or_slug: str,
+    request: Request,
     article_status: Optional[ArticleStatus] = None,
     article_service: ArticleServiceDep = None,
     current_optional_active_user= Depends(get_current_user_optional)
@@ -185,8 +247,38 @@ async def read_article(
         
         if not article:
             raise HTTPException(status_code=404, detail="Article not found")
-        
-        return JSONResponse(content=clean_document(article))
+
+        # Likes, bookmarks, comments and the image gallery are stored on the article
+        # without touching updated_at, so they are part of the version as well. So are
+        # the category, author and main image looked up when the article is read,
+        # which change without the article document changing at all
+        version = (
+            article.get("updated_at"),
+            article.get("likes"),
+            len(article.get("bookmarked_by") or []),
+            len(article.get("comments") or []),
+            article.get("images"),
+            article.get("category"),
+            article.get("author"),
+            article.get("main_image_file")
+        )
+        user_key = current_optional_active_user.id_str if current_optional_active_user else None
+        headers = {"ETag": make_etag(article["id"], user_key, *version)}
+        if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        # Signed-in readers get per-user is_liked/is_bookmarked flags, so only
+        # the anonymous rendering is shared between requests
+        if current_optional_active_user is not None:
+            return MongoJSONResponse(content=article, headers=headers)
+
+        cached = article_response_cache.get(article["id"])
+        if cached is not None and cached[0] == version:
+            return Response(content=cached[1], media_type="application/json", headers=headers)
+
+        content = dumps(article)
+        article_response_cache.set(article["id"], (version, content))
+        return Response(content=content, media_type="application/json", headers=headers)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -203,7 +295,7 @@ async def update_article(
     excerpt: Optional[str] = Form(None),
     category_id: Optional[str] = Form(None),
     read_time: Optional[int] = Form(None),
-    status: Optional[str] = Form(None),
+    new_status: Optional[str] = Form(None, alias="status"),
     tags: Optional[list] = Form(None),
     is_spotlight: Optional[bool] = Form(None),
     is_popular: Optional[bool] = Form(None),
@@ -214,98 +306,57 @@ async def update_article(
     Admins can edit any article while non-admins can only edit their own.
     """
     try:
-        print(f"[Update Article] Starting update for article {id}")
+        logger.debug("[Update Article] Starting update for article %s", id)
         
-        # Create a dictionary with the form data
-        filtered_data = {
-            "name": name,
-            "content": content,
-            "excerpt": excerpt,
-            "category_id": category_id,
-            "read_time": read_time,
-            "status": status,
-            "tags": tags,
-            "is_spotlight": is_spotlight,
-            "is_popular": is_popular
+        # Collect the submitted form values; the ArticleUpdate is built once all fields are known
+        form_values = (name, content, excerpt, category_id, read_time, new_status, tags, is_spotlight, is_popular)
+        update_data = {
+            field: value
+            for field, value in zip(ARTICLE_UPDATE_FIELDS, form_values)
+            if value is not None
         }
         
-        # Remove None values
-        filtered_data = {k: v for k, v in filtered_data.items() if v is not None}
-        
-        # Create an ArticleUpdate object from the filtered data
-        article_update = ArticleUpdate(**filtered_data)
-        
-        # Handle image upload if provided
-        if image_file and image_file.filename and image_file.filename is not None:
+        # Handle image upload if provided (a zero-byte upload is treated as no image)
+        if image_file and image_file.filename and (image_file.size or 0) > 0:
             try:
-                print(f"[Update Article] Processing image upload: {image_file.filename}")
-                
-                # Get MongoDB collection for file metadata
-                from db.db import get_db
-                mongo_collection = await get_db()
-                mongo_collection = mongo_collection.files
-                print(f"[Update Article] MongoDB collection retrieved: files")
-                
-                # Generate a unique file ID
-                from services.minio_service import generate_unique_file_id
-                file_id = await generate_unique_file_id(mongo_collection)
-                print(f"[Update Article] Generated file_id: {file_id}")
+                logger.debug("[Update Article] Processing image upload: %s %s", image_file.filename, image_file.content_type)
                 
                 # Organize by user_id/article_id/files
-                folder = f"{current_user.id}/{id}"
-                print(f"[Update Article] Storage folder path: {folder}")
+                folder = f"{current_user.id_str}/{id}"
+                logger.debug("[Update Article] Storage folder path: %s", folder)
                 
-                # Save the image to MinIO
-                from services.minio_service import upload_to_minio
+                # Save the image to MinIO. upload_to_minio assigns a random UUID file_id,
+                # and the unique index on files.file_id guards against collisions
                 file_data = await upload_to_minio(
-                    data=await image_file.read(),
+                    data=image_file.file,
                     filename=image_file.filename,
                     content_type=image_file.content_type,
                     minio_client=minio_client,
                     folder=folder
                 )
-                print(f"[Update Article] Image saved to MinIO: {file_data['object_name']}")
+                file_id = file_data["file_id"]
+                logger.debug("[Update Article] Generated file_id: %s", file_id)
+                logger.debug("[Update Article] Image saved to MinIO: %s", file_data["object_name"])
                 
                 # Store file metadata in MongoDB with additional user_id
-                file_data["user_id"] = str(current_user.id)
+                file_data["user_id"] = current_user.id_str
                 file_data["article_id"] = id
                 
                 # Generate slug for the file
-                from services.minio_service import create_slug
                 base_slug = await create_slug(os.path.splitext(image_file.filename)[0])
                 file_data["slug"] = f"{base_slug}-{file_data['unique_string']}"
                 
                 # Save to database
-                result = await mongo_collection.insert_one(file_data)
-                print(f"[Update Article] File metadata stored in MongoDB: {result.inserted_id}")
+                db = await get_db()
+                result = await db.files.insert_one(file_data)
+                logger.debug("[Update Article] File metadata stored in MongoDB: %s", result.inserted_id)
                 
                 # Set the image-related fields
-                article_update.image_file = file_id
-                article_update.image_id = file_id
-                
-                # Create main_image_file structure
-                # main_image_file = {
-                #     "file_id": file_data["file_id"],
-                #     "file_type": file_data["file_type"],
-                #     "file_extension": file_data["file_extension"],
-                #     "size": file_data["size"],
-                #     "object_name": file_data["object_name"],
-                #     "slug": file_data["slug"],
-                #     "unique_string": file_data["unique_string"]
-                # }
-                
-                # Ensure these fields are included in the update data
-                update_data = article_update.model_dump(exclude_unset=True)
-                update_data["image_file"] = file_data["file_id"]
-                update_data["image_id"] = file_data["file_id"]
-                # update_data["main_image_file"] = main_image_file
-                update_data["updated_at"] = get_current_utc_time()
-                
-                # Create a new ArticleUpdate object with the complete data
-                article_update = ArticleUpdate(**update_data)
+                update_data["image_file"] = file_id
+                update_data["image_id"] = file_id
                 
             except Exception as e:
-                print(f"[Update Article] Error processing image: {str(e)}")
+                logger.exception("[Update Article] Error processing image")
                 raise HTTPException(
                     status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                     detail=f"Error processing image: {str(e)}"
@@ -313,41 +364,41 @@ async def update_article(
             finally:
                 await image_file.close()
         else:
-            print("[Update Article] No image provided with the article update")
-            # If no image update, just add the timestamp
-            update_data = article_update.model_dump(exclude_unset=True)
-            update_data["updated_at"] = get_current_utc_time()
-            article_update = ArticleUpdate(**update_data)
+            logger.debug("[Update Article] No image provided with the article update")
+        
+        # Form values are already coerced by FastAPI, so skip Pydantic validation and
+        # only mark the submitted fields as set. updated_at is stamped by the service
+        article_update = ArticleUpdate.model_construct(**update_data)
         
         # Update the article
         try:
             # Update the article in the database
-            updated_article = await article_service.update_article(id, article_update, str(current_user.id))
-            print(f"[Update Article] Successfully updated article in database")
+            updated_article = await article_service.update_article(id, article_update, current_user.id_str)
+            logger.debug("[Update Article] Successfully updated article in database")
             
             if not updated_article:
-                print(f"[Update Article] Article not found after update")
+                logger.debug("[Update Article] Article not found after update")
                 raise HTTPException(status_code=404, detail="Article not found")
             
-            # Enrich the article with the new image data
-            enriched_article = await article_service.article_repo.enrich_article(updated_article)
-            print(f"[Update Article] Successfully enriched article with new image data")
-            
-            return JSONResponse(content=enriched_article)
+            invalidate_article_caches(id)
+
+            # The service already returns the article enriched with its category, author and image
+            return ORJSONResponse(content=updated_article)
         except Exception as e:
-            print(f"[Update Article] Error updating article in database: {str(e)}")
+            logger.exception("[Update Article] Error updating article in database")
             raise HTTPException(status_code=500, detail=f"Failed to update article: {str(e)}")
             
     except HTTPException as e:
-        print(f"[Update Article] HTTP Exception: {str(e)}")
+        logger.debug("[Update Article] HTTP Exception: %s", e)
         raise e
     except Exception as e:
-        print(f"[Update Article] Unexpected error: {str(e)}")
+        logger.exception("[Update Article] Unexpected error")
         raise HTTPException(status_code=500, detail=f"Server error: {str(e)}")
 
 
 @router.get("/home/", response_model=Dict[str, Any])
 async def get_home_page_articles(
+    request: Request,
     article_service: ArticleServiceDep,
     get_optional_current_user = Depends(get_current_user_optional)
     ):
@@ -356,7 +407,19 @@ async def get_home_page_articles(
     and articles grouped by category.
     """
     try:
-        home_data = await article_service.get_home_page_articles(get_optional_current_user)
+        # Anonymous visitors share one entry; signed-in users get their own
+        # because is_liked/is_bookmarked depend on the user
+        cache_key = get_optional_current_user.id_str if get_optional_current_user else None
+
+        async def build_home_page():
+            home_data = await article_service.get_home_page_articles(get_optional_current_user)
+            content = orjson.dumps(home_data)
+            return make_etag(cache_key, content), content
+
+        etag, content = await home_page_cache.get_or_set(cache_key, build_home_page)
+        headers = {"ETag": etag}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
         # Transform _id to id in the response data
         # if "by_category" in home_data:
         #     for category in home_data["by_category"]:
@@ -365,7 +428,7 @@ async def get_home_page_articles(
         #                 article["id"] = article.pop("_id")
         #             if "author" in article and "_id" in article["author"]:
         #                 article["author"]["id"] = article["author"].pop("_id")
-        return JSONResponse(content=home_data)
+        return Response(content=content, media_type="application/json", headers=headers)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Server error: {str(e)}")
 
@@ -377,12 +440,14 @@ async def request_article_publish(
 ):
     """Request to publish an article (only for article authors)"""
     try:
-        result = await article_service.request_article_publish(id, str(current_user.id))
+        result = await article_service.request_article_publish(id, current_user.id_str)
         
         if not result:
             raise HTTPException(status_code=404, detail="Article not found")
         
-        return JSONResponse(content=result)
+        # Articles may be published straight away when auto-publish is enabled
+        invalidate_article_caches(id)
+        return ORJSONResponse(content=result)
     except ValueError as e:
         # Handle validation errors from the service layer
         raise HTTPException(status_code=400, detail=str(e))
@@ -391,7 +456,7 @@ async def request_article_publish(
         raise e
     except Exception as e:
         # Log the full error for debugging
-        print(f"Error in request_article_publish: {str(e)}")
+        logger.exception("request_article_publish failed")
         # Return a more specific error message
         raise HTTPException(
             status_code=500,
@@ -408,46 +473,170 @@ async def delete_article(
     try:
         result = await article_service.delete_article(
             article_id, 
-            str(current_user.id),
+            current_user.id_str,
             current_user.user_type
         )
         
         if not result:
             raise HTTPException(status_code=404, detail="Article not found")
-        
+
+        invalidate_article_caches(article_id)
         return Response(status_code=status.HTTP_204_NO_CONTENT)
     except HTTPException as e:
         raise e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Server error: {str(e)}")
     
+async def ensure_can_edit_article(article_service, article_id: str, current_user) -> Dict[str, Any]:
+    """Return the article if the current user is its author or an admin, raising otherwise"""
+    if not ObjectId.is_valid(article_id):
+        raise HTTPException(status_code=404, detail="Article not found")
+    article = await article_service.article_repo.get_article_by_id(article_id)
+    if not article:
+        raise HTTPException(status_code=404, detail="Article not found")
+    if article.get("author_id") != current_user.id_str and current_user.user_type != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
+    return article
+
+@router.post("/{article_id}/images/presign")
+async def presign_article_image_upload(
+    article_id: str,
+    presign_request: ArticleImagePresignRequest,
+    current_user: CurrentActiveUser,
+    article_service: ArticleServiceDep,
+    minio_client: Minio = Depends(get_object_storage)
+):
+    """
+    Get a presigned URL to upload an article's main image straight to object storage.
+    The client PUTs the image body to the returned URL and then calls
+    /{article_id}/images/confirm with the returned file_id and object_name.
+    Images uploaded this way are stored as sent and are not converted to WebP.
+    """
+    try:
+        await ensure_can_edit_article(article_service, article_id, current_user)
+        return await create_presigned_upload(
+            minio_client,
+            filename=presign_request.filename,
+            folder=f"{current_user.id_str}/{article_id}"
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Server error: {str(e)}")
+
+@router.post("/{article_id}/images/confirm", response_model=Dict[str, Any])
+async def confirm_article_image_upload(
+    article_id: str,
+    upload: ArticleImageConfirm,
+    current_user: CurrentActiveUser,
+    article_service: ArticleServiceDep,
+    minio_client: Minio = Depends(get_object_storage)
+):
+    """
+    Register an image uploaded through a presigned URL and set it as the article's main image.
+    """
+    try:
+        await ensure_can_edit_article(article_service, article_id, current_user)
+        
+        # Only accept objects inside the folder handed out by the presign endpoint
+        folder = f"{current_user.id_str}/{article_id}/"
+        if not upload.object_name.startswith(folder + upload.file_id + "."):
+            raise HTTPException(status_code=400, detail="Object name does not match this upload")
+        
+        file_data = await describe_uploaded_object(
+            minio_client,
+            file_id=upload.file_id,
+            object_name=upload.object_name,
+            filename=upload.filename
+        )
+        file_data["user_id"] = current_user.id_str
+        file_data["article_id"] = article_id
+        file_data["slug"] = f"{file_data['slug']}-{file_data['unique_string']}"
+        
+        db = await get_db()
+        await db.files.insert_one(file_data)
+        
+        updated_article = await article_service.article_repo.update_article(article_id, {
+            "image_file": upload.file_id,
+            "image_id": upload.file_id,
+            "updated_at": get_current_utc_time()
+        })
+        if not updated_article:
+            raise HTTPException(status_code=404, detail="Article not found")
+        invalidate_article_caches(article_id)
+        
+        enriched_article = await article_service.article_repo.enrich_article(updated_article)
+        return ORJSONResponse(content=enriched_article)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Server error: {str(e)}")
+
 @router.post("/{article_id}/images")
 async def upload_article_image(
     article_id: str,
-    file: UploadFile = File(...),
+    file: List[UploadFile] = File(...),
     is_main: bool = Form(False),
     is_thumbnail: bool = Form(False),
     caption: Optional[str] = Form(None),
     current_user: CurrentActiveUser = None,
-    article_service: ArticleServiceDep = None
+    article_service: ArticleServiceDep = None,
+    minio_client: Minio = Depends(get_object_storage)
 ):
-    """Upload an image for an article"""
+    """
+    Upload one or more images for an article.
+    Send several "file" parts to upload a gallery in one request; is_main and
+    is_thumbnail apply to the first image and caption to all of them.
+    """
     try:
-        # This would normally save file to storage (S3, etc.)
-        # For demo, we'll just create a placeholder URL
-        file_extension = os.path.splitext(file.filename)[1]
-        file_name = f"{uuid.uuid4()}{file_extension}"
-        file_path = f"/uploads/articles/{article_id}/{file_name}"
+        await ensure_can_edit_article(article_service, article_id, current_user)
         
-        # Call service to add image to article
-        updated_article = await article_service.article_repo.upload_article_image(
-            article_id, file_path, is_main, is_thumbnail, caption
-        )
+        uploads = [f for f in file if f.filename and (f.size or 0) > 0]
+        if not uploads:
+            raise HTTPException(status_code=400, detail="No image provided")
+        
+        # Upload every image to MinIO concurrently
+        folder = f"{current_user.id_str}/{article_id}"
+        try:
+            files_data = await asyncio.gather(*[
+                upload_to_minio(
+                    data=upload.file,
+                    filename=upload.filename,
+                    content_type=upload.content_type,
+                    minio_client=minio_client,
+                    folder=folder
+                )
+                for upload in uploads
+            ])
+        finally:
+            await asyncio.gather(*[upload.close() for upload in uploads])
+        
+        for file_data in files_data:
+            file_data["user_id"] = current_user.id_str
+            file_data["article_id"] = article_id
+            file_data["slug"] = f"{file_data['slug']}-{file_data['unique_string']}"
+        
+        # Store all of the file metadata in one round-trip
+        db = await get_db()
+        await db.files.insert_many(files_data, ordered=False)
+        
+        images = [
+            {
+                "url": f"/storage/files/{file_data['file_id']}",
+                "file_id": file_data["file_id"],
+                "is_main": is_main and index == 0,
+                "is_thumbnail": is_thumbnail and index == 0,
+                "caption": caption
+            }
+            for index, file_data in enumerate(files_data)
+        ]
+        updated_article = await article_service.article_repo.upload_article_images(article_id, images)
         
         if not updated_article:
             raise HTTPException(status_code=404, detail="Article not found")
         
-        return JSONResponse(content=updated_article)
+        invalidate_article_caches(article_id)
+        return ORJSONResponse(content=updated_article)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -469,7 +658,8 @@ async def delete_article_image(
         if not updated_article:
             raise HTTPException(status_code=404, detail="Article not found")
         
-        return JSONResponse(content=updated_article)
+        invalidate_article_caches(article_id)
+        return ORJSONResponse(content=updated_article)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -483,8 +673,9 @@ async def like_article(
 ):
     """Like an article"""
     try:
-        result = await article_service.like_article(article_id, str(current_user.id))
-        return result
+        result = await article_service.like_article(article_id, current_user.id_str)
+        home_page_cache.invalidate(current_user.id_str)
+        return ORJSONResponse(content=result)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -498,13 +689,33 @@ async def unlike_article(
 ):
     """Unlike an article"""
     try:
-        result = await article_service.unlike_article(article_id, str(current_user.id))
-        return result
+        result = await article_service.unlike_article(article_id, current_user.id_str)
+        home_page_cache.invalidate(current_user.id_str)
+        return ORJSONResponse(content=result)
     except HTTPException as e:
         raise e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Server error: {str(e)}")
 
+@router.post("/likes/bulk", response_model=Dict[str, Dict[str, Any]])
+async def get_articles_likes_bulk(
+    likes_request: ArticleLikesBulkRequest,
+    current_user: OptionalUser,
+    article_service: ArticleServiceDep
+):
+    """
+    Get like counts for several articles in one request.
+    When include_user is set and the caller is signed in, each entry also
+    says whether the caller liked that article.
+    """
+    try:
+        user_id = current_user.id_str if current_user and likes_request.include_user else None
+        return await article_service.get_articles_likes_bulk(likes_request.article_ids, user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Server error: {str(e)}")
+
 @router.get("/{article_id}/likes", response_model=List[str])
 async def get_article_likes_users(
     article_id: str,
@@ -519,7 +730,7 @@ async def get_article_likes_users(
         raise HTTPException(status_code=500, detail=f"Server error: {str(e)}")
 
 @router.get("/{article_id}/likes/count", response_model=int)
-async def get_article_likes_users(
+async def get_article_likes_count(
     article_id: str,
     article_service: ArticleServiceDep
 ):
@@ -540,7 +751,8 @@ async def approve_article(
     """Approve an article for publication (admin only)"""
     try:
         result = await article_service.article_repo.approve_article(article_id)
-        return JSONResponse(content=result)
+        invalidate_article_caches(article_id)
+        return ORJSONResponse(content=result)
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -552,38 +764,34 @@ async def get_following_articles(
     article_service: ArticleServiceDep,
     user_service: UserServiceDep,
     skip: int = 0,
-    limit: int = 20
+    limit: int = 20,
+    after: Optional[str] = None
 ):
     """
     Get articles from users that the current user follows.
     Returns a list of articles sorted by published date.
+    Pass after=<created_at>,<id> of the last article of the previous page to get the next page.
     """
+    cursor = get_page_cursor(after)
     try:
-        print(f"Current user: {current_user}")
-        print(f"Current user ID: {current_user.id}")
-        
-        # Get the list of users that the current user follows
-        following_users = await user_service.get_following(current_user)
-        print(f"Following users: {following_users}")
+        logger.debug("[Following Articles] Fetching feed for user_id: %s", current_user.id)
         
-        # Extract user IDs from the dictionaries
-        following_user_ids = [user["id"] for user in following_users]
-        print(f"Following user ids: {following_user_ids}")
-
-        if not following_user_ids:
-            print("No following users found")
-            return JSONResponse(content=[])
+        # Get the ObjectIds of the users that the current user follows
+        following_object_ids = await user_service.get_following_ids(current_user.id_str)
+        logger.debug("[Following Articles] Following user ids: %s", following_object_ids)
 
-        # Convert user IDs to ObjectId
-        following_object_ids = [ObjectId(user_id) for user_id in following_user_ids]
-        print(f"Following object ids: {following_object_ids}")
+        if not following_object_ids:
+            logger.debug("[Following Articles] No following users found")
+            return ORJSONResponse(content=[])
 
         # Build the query
         query = {
             "author_id": {"$in": following_object_ids},
-            "status": ArticleStatus.published.value
+            "status": PUBLISHED_STATUS
         }
-        print(f"Query: {query}")
+        if cursor is not None:
+            query.update(keyset_filter(*cursor))
+        logger.debug("[Following Articles] Query: %s", query)
 
         # Get articles from followed users using direct query
         articles = await article_service.article_repo.get_articles_by_query(
@@ -593,16 +801,11 @@ async def get_following_articles(
             current_user=current_user
         )
 
-        print(f"Found {len(articles)} articles")
-        if articles:
-            print(f"First article: {articles[0] if articles else 'None'}")
+        logger.debug("[Following Articles] Found %d articles", len(articles))
 
-        return JSONResponse(content=articles)
+        return ORJSONResponse(content=articles)
     except Exception as e:
-        print(f"Error in get_following_articles: {str(e)}")
-        print(f"Error type: {type(e)}")
-        import traceback
-        print(f"Traceback: {traceback.format_exc()}")
+        logger.exception("[Following Articles] Error fetching articles")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An error occurred: {str(e)}"
@@ -611,7 +814,7 @@ async def get_following_articles(
 @router.put("/{id}/status", response_model=Dict[str, Any])
 async def update_article_status(
     id: str,
-    status: str = Form(...),
+    new_status: str = Form(..., alias="status"),
     current_user = Depends(get_current_active_user),
     article_service: ArticleServiceDep = None
 ):
@@ -621,17 +824,17 @@ async def update_article_status(
     """
     try:
         # Validate status
-        if status not in ["draft", "archived", "deleted"]:
+        if new_status not in ["draft", "archived", "deleted"]:
             raise HTTPException(
-                status_code=400,
+                status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Status must be either 'draft', 'archived', or 'deleted'"
             )
 
         # Update the article status
         updated_article = await article_service.update_article_status(
             id,
-            status,
-            str(current_user.id)
+            new_status,
+            current_user.id_str
         )
 
         if not updated_article:
@@ -640,7 +843,8 @@ async def update_article_status(
                 detail="Article not found or you don't have permission to update it"
             )
 
-        return JSONResponse(content=updated_article)
+        invalidate_article_caches(id)
+        return ORJSONResponse(content=updated_article)
     except HTTPException as e:
         raise e
     except Exception as e:
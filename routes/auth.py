@@ -1,20 +1,32 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Form
-from datetime import timedelta, datetime, timezone
-import random
-import string
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Form
+from bson import ObjectId
+from pymongo import DeleteMany, InsertOne
+from datetime import timedelta
+from itertools import product
+from typing import Any, Dict
+import re
+import secrets
 
 from db.db import get_db
-from models.auth_model import Token, PasswordResetRequest, PasswordReset
+from db.init_db import CASE_INSENSITIVE_INDEXES
+from db.mongodb import CASE_INSENSITIVE_COLLATION, EPHEMERAL_WRITE_CONCERN
+from models.auth_model import Token, PasswordResetRequest, PasswordReset, PASSWORD_RESET_CODE_TTL_SECONDS
 from dependencies.auth import AuthServiceDep
 from dependencies.db import DB
 from utils.security import get_password_hash
 from utils.time import get_current_utc_time
 from services.email_service import EmailService
+from logger.logger import logger
+from config import settings
 
 router = APIRouter()
 
+# (collection, field) pairs check_availability may query, all backed by an index
+AVAILABILITY_FIELDS = frozenset(CASE_INSENSITIVE_INDEXES)
+
 @router.post("/token", response_model=Token)
 async def login_for_access_token(
+    background_tasks: BackgroundTasks,
     username: str = Form(...),
     password: str = Form(...),
     auth_service: AuthServiceDep = None
@@ -23,7 +35,7 @@ async def login_for_access_token(
     Authenticate user and return JWT access token
     """
     try:
-        token = await auth_service.generate_user_token(username, password)
+        token = await auth_service.generate_user_token(username, password, background_tasks)
         if not token:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -41,9 +53,17 @@ async def login_for_access_token(
             detail=f"Authentication error: {str(e)}"
         )
 
+async def send_reset_code_email(db, email: str, code: str, code_id: ObjectId) -> None:
+    """Send a password reset code by email, removing the code if it could not be delivered"""
+    email_sent = await EmailService.send_password_reset_email(email, code)
+    if not email_sent:
+        logger.error("Failed to send password reset email for code %s", code_id)
+        await db.password_reset_codes.delete_one({"_id": code_id})
+
 @router.post("/forgot-password")
 async def request_password_reset(
     request: PasswordResetRequest,
+    background_tasks: BackgroundTasks,
     db = Depends(get_db)
 ):
     """
@@ -51,44 +71,32 @@ async def request_password_reset(
     """
     try:
         # Check if user exists
-        user = await db.users.find_one({"email": request.email})
+        user = await db.users.find_one({"email": request.email}, {"_id": 1})
         if not user:
             # Don't reveal if email exists or not for security
             return {"message": "If your email is registered, you will receive a password reset code."}
 
-        # Generate a random 6-digit code
-        code = ''.join(random.choices(string.digits, k=6))
+        # Generate a random 6-digit code from the OS CSPRNG
+        code = f"{secrets.randbelow(1_000_000):06d}"
         
         # Store the code in the database
         reset_code = {
+            "_id": ObjectId(),
             "email": request.email,
             "code": code,
-            "created_at": get_current_utc_time(),
-            "is_active": True
+            "created_at": get_current_utc_time()
         }
         
-        # Deactivate any existing codes for this email
-        await db.password_reset_codes.update_many(
-            {"email": request.email},
-            {"$set": {"is_active": False}}
-        )
+        # Replace any existing codes for this email with the new one in a single round-trip,
+        # codes expire within minutes so they are not worth waiting on the journal for
+        reset_codes = db.password_reset_codes.with_options(write_concern=EPHEMERAL_WRITE_CONCERN)
+        await reset_codes.bulk_write([
+            DeleteMany({"email": request.email}),
+            InsertOne(reset_code)
+        ], ordered=True)
         
-        # Insert the new code
-        await db.password_reset_codes.insert_one(reset_code)
-        
-        # Send email with reset code
-        email_sent = await EmailService.send_password_reset_email(request.email, code)
-        
-        if not email_sent:
-            # If email fails, deactivate the code and raise an error
-            await db.password_reset_codes.update_one(
-                {"_id": reset_code["_id"]},
-                {"$set": {"is_active": False}}
-            )
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to send password reset email"
-            )
+        # Send the email after responding, the SMTP exchange dominates this endpoint's latency
+        background_tasks.add_task(send_reset_code_email, db, request.email, code, reset_code["_id"])
         
         return {"message": "Password reset code sent to your email."}
         
@@ -109,12 +117,14 @@ async def reset_password(
     Reset password using the code sent to user's email
     """
     try:
-        # Find the most recent active code for this email
-        reset_code = await db.password_reset_codes.find_one({
+        # Validate and consume the code in one atomic round-trip. The TTL monitor only
+        # runs once a minute, so codes past their lifetime are filtered out explicitly
+        expires_before = get_current_utc_time() - timedelta(seconds=PASSWORD_RESET_CODE_TTL_SECONDS)
+        reset_code = await db.password_reset_codes.find_one_and_delete({
             "email": request.email,
             "code": request.code,
-            "is_active": True
-        })
+            "created_at": {"$gt": expires_before}
+        }, projection={"_id": 1})
         
         if not reset_code:
             raise HTTPException(
@@ -122,33 +132,13 @@ async def reset_password(
                 detail="Invalid or expired reset code"
             )
             
-        # Check if code is less than 15 minutes old
-        current_time = datetime.now(timezone.utc)
-        code_created_at = reset_code["created_at"]
-        
-        # Ensure code_created_at is timezone-aware
-        if code_created_at.tzinfo is None:
-            code_created_at = code_created_at.replace(tzinfo=timezone.utc)
-            
-        code_age = current_time - code_created_at
-        if code_age > timedelta(minutes=15):
-            # Deactivate expired code
-            await db.password_reset_codes.update_one(
-                {"_id": reset_code["_id"]},
-                {"$set": {"is_active": False}}
-            )
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Reset code has expired"
-            )
-            
         # Hash the new password
         hashed_password = get_password_hash(request.new_password)
         
         # Update user's password
         result = await db.users.update_one(
             {"email": request.email},
-            {"$set": {"password_hash": hashed_password}}
+            {"$set": {"password_hash": hashed_password}, "$inc": {"token_version": 1}}
         )
         
         if result.modified_count == 0:
@@ -156,12 +146,6 @@ async def reset_password(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
-            
-        # Deactivate the used code
-        await db.password_reset_codes.update_one(
-            {"_id": reset_code["_id"]},
-            {"$set": {"is_active": False}}
-        )
         
         return {"message": "Password has been reset successfully"}
         
@@ -173,6 +157,20 @@ async def reset_password(
             detail=f"Error resetting password: {str(e)}"
         )
 
+def _ci_prefix_selectors(field: str, value: str) -> Dict[str, Any]:
+    """
+    Build a case-insensitive exact-match filter that can still use a plain index.
+    Anchored, case-sensitive regexes over every upper/lower case spelling of the
+    first four characters are index range scans; the full case-insensitive regex
+    then only checks the documents those scans return
+    """
+    exact = {field: {"$regex": f"^{re.escape(value)}$", "$options": "i"}}
+    if not value:
+        return exact
+    spellings = product(*({c.lower(), c.upper()} for c in value[:4]))
+    prefixes = [{field: {"$regex": "^" + re.escape("".join(spelling))}} for spelling in spellings]
+    return {"$and": [{"$or": prefixes}, exact]}
+
 @router.get("/check-availability")
 async def check_availability(
     collection: str, 
@@ -194,15 +192,26 @@ async def check_availability(
       - available (bool): True if the value is not taken; False otherwise.
       - message (str): A message indicating the status.
     """
+    # Only indexed, non-sensitive fields can be probed, anything else would
+    # scan a collection or leak data such as reset codes
+    if (collection, field) not in AVAILABILITY_FIELDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Availability cannot be checked for {collection}.{field}"
+        )
+    
     try:
         coll = db[collection]
-        if not case_sensitive:
-            # Case-insensitive: use a regex that matches the entire string (ignoring case)
-            query = {field: {"$regex": f"^{value}$", "$options": "i"}}
+        if not case_sensitive and settings.USE_COLLATION_INDEX:
+            # Case-insensitive: an exact match under a case-insensitive collation,
+            # which can use the matching {field}_ci index instead of scanning
+            document = await coll.find_one({field: value}, {"_id": 1}, collation=CASE_INSENSITIVE_COLLATION)
+        elif not case_sensitive:
+            # Case-insensitive without collation support: prefix scans on the plain index
+            document = await coll.find_one(_ci_prefix_selectors(field, value), {"_id": 1})
         else:
-            query = {field: value}
+            document = await coll.find_one({field: value}, {"_id": 1})
         
-        document = await coll.find_one(query)
         if document:
             return {"available": False, "message": f"{field} is already taken."}
         return {"available": True, "message": f"{field} is available."}
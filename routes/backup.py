@@ -1,40 +1,64 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, status, BackgroundTasks, Query
-from fastapi.responses import StreamingResponse
+from fastapi.responses import FileResponse
 from db.db import get_db, get_object_storage
 from minio import Minio
 from datetime import datetime
 import os
-import io
 import zipfile
 import hashlib
-import json
 from config import settings
-from typing import Optional, Any, Dict, Tuple
+from typing import BinaryIO, List, Optional, Any, Dict, Tuple
+import shutil
 import tempfile
-from bson import ObjectId
+import threading
+import time
 import asyncio
+from collections import deque
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
+import re
+import orjson
+from bson import Timestamp
+from pymongo.errors import PyMongoError
+from utils.cache import TTLCache
+from utils.serialization import dumps
+from logger.logger import logger
 
 # Constants
 CHECKSUMS_FILENAME = 'checksums.json'
 MONGODB_BACKUP_FILENAME = 'mongodb_backup.json'
 MINIO_BACKUP_FILENAME = 'minio_backup.zip'
+MINIO_MANIFEST_FILENAME = 'minio_manifest.json'  # ETags of the backed up objects, for reuse by the next backup
 DEFAULT_TIMEOUT = 300  # 5 minutes timeout for operations
+BACKUP_ENTRY_DATE = (2025, 1, 1, 0, 0, 0)  # Fixed timestamp for the members of the backup ZIP file
+BACKUP_BATCH_SIZE = 1000  # Documents fetched per cursor batch while dumping MongoDB
+COPY_CHUNK_SIZE = 1024 * 1024  # Bytes copied at a time into backup zip files
+# Object types that are already compressed and are stored in the MinIO zip as-is
+PRECOMPRESSED_EXTENSIONS = frozenset({
+    '.webp', '.jpg', '.jpeg', '.png', '.gif', '.avif', '.heic',
+    '.mp3', '.mp4', '.webm', '.mov', '.zip', '.gz', '.bz2', '.xz', '.zst', '.7z', '.pdf'
+})
+BACKUP_DUMP_CONCURRENCY = 4  # Collections dumped at once, leaving pool connections for regular requests
+# Deflate level for MinIO objects that are not already compressed, 1 is several times faster than the default 6
+MINIO_BACKUP_COMPRESSLEVEL = 1
+MINIO_BACKUP_CONCURRENCY = 16  # MinIO objects downloaded at once, within the client's connection pool
+MINIO_READ_SIZE = 4 * 1024 * 1024  # Bytes read per call from a MinIO download, at most 64 MiB across all downloads
+BACKUP_WRITE_BUFFER_SIZE = 8 * 1024 * 1024  # Bytes buffered before each write to the backup file
 
 router = APIRouter()
 
-class MongoDBEncoder(json.JSONEncoder):
-    """JSON encoder for MongoDB specific types"""
-    def default(self, obj: Any) -> Any:
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if isinstance(obj, ObjectId):
-            return str(obj)
-        return super().default(obj)
+# Collection names rarely change, so backups taken in quick succession reuse the listing
+backup_collections_cache = TTLCache(maxsize=8, ttl=60)
+# Checksum sets of backups known to be valid, so repeated quick verifications skip the database
+verified_backups_cache = TTLCache(maxsize=1024, ttl=3600)
 
 # ----- Utility Functions -----
 
-async def calculate_checksum(data: bytes) -> str:
-    """Calculate SHA-256 checksum of data"""
+def calculate_checksum(data: bytes) -> str:
+    """
+    Calculate SHA-256 checksum of data.
+    hashlib's SHA-256 comes from OpenSSL, which uses the CPU's SHA extensions when available
+    """
     return hashlib.sha256(data).hexdigest()
 
 async def execute_with_timeout(coro, timeout=DEFAULT_TIMEOUT):
@@ -104,154 +128,446 @@ async def get_backup_by_mongo_checksum(db, mongo_checksum: str) -> Optional[Dict
     except Exception as e:
         return None
 
-async def store_backup_info(db, mongo_checksum: str, minio_checksum: str, combined_checksum: str, relative_path: str, absolute_path: str) -> None:
+async def store_backup_info(
+    db, mongo_checksum: str, minio_checksum: str, combined_checksum: str, relative_path: str, absolute_path: str,
+    change_tag: Optional[Timestamp] = None
+) -> None:
     """Store backup checksums and paths in the database for future reference"""
     try:
         await db.backups.insert_one({
             "timestamp": datetime.now(),
+            "change_tag": change_tag,
             "mongo_checksum": mongo_checksum,
             "minio_checksum": minio_checksum, 
             "combined_checksum": combined_checksum,
             "relative_path": relative_path,
             "absolute_path": absolute_path
         })
-        print(f"Stored backup info: {mongo_checksum[:8]}..., {minio_checksum[:8]}...")
+        logger.info("Stored backup info: %s..., %s...", mongo_checksum[:8], minio_checksum[:8])
     except Exception as e:
-        print(f"Error storing backup info: {str(e)}")
+        logger.error("Error storing backup info: %s", e)
         raise e
 
-# ----- Backup Operations -----
+async def get_change_tag(db) -> Optional[Timestamp]:
+    """
+    Get the oplog timestamp of the last write to the deployment, or None when it has
+    no oplog (standalone server) or cannot be asked. A dump started after reading it
+    contains every write up to that timestamp
+    """
+    try:
+        last_write = (await db.client.admin.command("hello")).get("lastWrite")
+        return last_write["opTime"]["ts"] if last_write else None
+    except (PyMongoError, KeyError) as e:
+        logger.warning("Could not read the oplog time: %s", e)
+        return None
 
-async def backup_mongodb(db) -> bytes:
-    """Backup MongoDB collections to JSON"""
+async def mongodb_unchanged_since(db, change_tag: Optional[Timestamp]) -> bool:
+    """
+    Check the oplog for writes to this database after change_tag, without dumping it.
+    Writes to the backups collection itself and periodic no-op entries are ignored,
+    transactions (applyOps on admin.$cmd) count as changes. Any doubt, such as the
+    oplog having rolled over past change_tag, is reported as changed
+    """
+    if change_tag is None:
+        return False
+    oplog = db.client.local["oplog.rs"]
     try:
-        collections = await db.list_collection_names()
-        collections = sorted(collections) # Sort collections for consistent ordering
-        backup_data = {}
-        
-        for collection_name in collections:
-            # Skip system collections and the backups collection
-            if collection_name.startswith('system.') or collection_name == 'backups':
-                continue
-                
-            collection = db[collection_name]
-            documents = await collection.find({}).to_list(length=None)
+        oldest = await oplog.find_one({}, {"ts": 1}, sort=[("$natural", 1)])
+        if not oldest or oldest["ts"] > change_tag:
+            return False
+        change = await oplog.find_one({
+            "ts": {"$gt": change_tag},
+            "op": {"$ne": "n"},
+            "ns": {"$regex": f"^(?:{re.escape(db.name)}\\.|admin\\.\\$cmd$)", "$ne": f"{db.name}.backups"}
+        }, {"ts": 1})
+        return change is None
+    except PyMongoError as e:
+        logger.warning("Could not read the oplog: %s", e)
+        return False
+
+# ----- Backup Operations -----
+
+async def get_backup_collections(db) -> List[str]:
+    """List the collections to back up in a consistent order, skipping system collections and the backups collection"""
+    async def load() -> List[str]:
+        return sorted(
+            name for name in await db.list_collection_names()
+            if not (name.startswith('system.') or name == 'backups')
+        )
+    return await backup_collections_cache.get_or_set(db.name, load)
 
+async def dump_collection(db, collection_name: str, semaphore: asyncio.Semaphore) -> BinaryIO:
+    """
+    Dump one collection as a JSON array into a temporary file, one document per line.
+    The caller owns the returned file and must close it
+    """
+    out = tempfile.SpooledTemporaryFile(max_size=COPY_CHUNK_SIZE)
+    try:
+        async with semaphore:
+            out.write(b"[")
             # Sort documents by _id for consistent ordering
-            documents = sorted(documents, key=lambda x: str(x.get('_id', '')))
-            backup_data[collection_name] = documents
-        
-        # Use a deterministic JSON format (sorted keys, fixed indentation)
-        return json.dumps(backup_data, sort_keys=True, indent=2, cls=MongoDBEncoder).encode('utf-8')
-    except Exception as e:
-        raise e
+            first = True
+            cursor = db[collection_name].find({}).sort("_id", 1).batch_size(BACKUP_BATCH_SIZE)
+            async for document in cursor:
+                out.write(b"\n" if first else b",\n")
+                first = False
+                out.write(dumps(document, orjson.OPT_SORT_KEYS))
+            out.write(b"]")
+        out.seek(0)
+        return out
+    except BaseException:
+        out.close()
+        raise
+
+async def backup_mongodb(db, out: BinaryIO) -> None:
+    """
+    Write MongoDB collections to out as a compact {collection: [documents]} JSON object,
+    one cursor batch at a time and one document per line, without holding the dump in memory.
+    Collections are dumped concurrently into temporary files and then joined in name order.
+    Documents are encoded by orjson with sorted keys so unchanged data gives the same checksum
+    """
+    collections = await get_backup_collections(db)
+    semaphore = asyncio.Semaphore(BACKUP_DUMP_CONCURRENCY)
+    tasks = [asyncio.create_task(dump_collection(db, name, semaphore)) for name in collections]
+    try:
+        parts = await asyncio.gather(*tasks)
+        out.write(b"{")
+        for index, (collection_name, part) in enumerate(zip(collections, parts)):
+            if index:
+                out.write(b",")
+            out.write(b"\n" + dumps(collection_name) + b":")
+            await asyncio.to_thread(shutil.copyfileobj, part, out, COPY_CHUNK_SIZE)
+        out.write(b"\n}" if collections else b"}")
+    finally:
+        for task in tasks:
+            if not task.done():
+                # Unfinished dumps close their own file once the cancellation lands
+                task.cancel()
+            elif not task.cancelled() and task.exception() is None:
+                task.result().close()
+
+class HashingWriter:
+    """
+    Write-only wrapper that feeds everything written to a file into a SHA-256 hash,
+    so a backup payload is checksummed while it is produced instead of re-read afterwards.
+    It has no tell/seek, so zipfile treats it as a stream and writes data descriptors
+    """
+    def __init__(self, file: BinaryIO):
+        self.file = file
+        self.hash = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        self.hash.update(data)
+        return self.file.write(data)
+
+    def flush(self) -> None:
+        self.file.flush()
+
+    def hexdigest(self) -> str:
+        return self.hash.hexdigest()
 
-async def backup_minio(minio_client: Minio) -> bytes:
-    """Backup MinIO bucket contents"""
+def minio_compress_type(object_name: str) -> int:
+    """Pick the zip compression for a MinIO object, skipping deflate for already compressed formats"""
+    extension = os.path.splitext(object_name)[1].lower()
+    return zipfile.ZIP_STORED if extension in PRECOMPRESSED_EXTENSIONS else zipfile.ZIP_DEFLATED
+
+class BackupCancelled(Exception):
+    """Raised inside the MinIO backup thread when its result is no longer needed"""
+
+def download_minio_object(minio_client: Minio, bucket_name: str, object_name: str) -> BinaryIO:
+    """
+    Download one MinIO object into a temporary file in chunks, meant to run in a worker thread.
+    Small objects stay in memory. The caller owns the returned file and must close it
+    """
+    out = tempfile.SpooledTemporaryFile(max_size=COPY_CHUNK_SIZE)
+    try:
+        data = minio_client.get_object(bucket_name, object_name)
+        try:
+            for chunk in data.stream(MINIO_READ_SIZE):
+                out.write(chunk)
+        finally:
+            data.close()  # Close the MinIO object
+            data.release_conn()
+        out.seek(0)
+        return out
+    except BaseException:
+        out.close()
+        raise
+
+def write_minio_backup(
+    minio_client: Minio,
+    cancelled: threading.Event,
+    out: HashingWriter,
+    previous: Optional[zipfile.ZipFile] = None,
+    previous_etags: Optional[Dict[str, str]] = None
+) -> Dict[str, str]:
+    """
+    Zip the MinIO bucket contents into out using the blocking SDK, meant to run in a worker thread.
+    Up to MINIO_BACKUP_CONCURRENCY objects are downloaded at once so their round-trips overlap,
+    while the zip itself is written by this thread in listing order.
+    Objects whose ETag matches previous_etags are copied from the previous MinIO backup zip instead
+    of being downloaded again. Returns the ETag of every object written, keyed by object name.
+    The backup stops between objects once cancelled is set
+    """
     bucket_name = settings.MINIO_BUCKET
-    
-    # Create a temporary file
-    temp_file = tempfile.NamedTemporaryFile(delete=False)
-    temp_path = temp_file.name
-    temp_file.close()  # Close the file so we can use it with ZipFile
+    previous_etags = previous_etags or {}
+    etags = {}
+    executor = ThreadPoolExecutor(max_workers=MINIO_BACKUP_CONCURRENCY, thread_name_prefix="minio-backup")
+    pending = deque()
     
     try:
-        # Create zip file
-        with zipfile.ZipFile(temp_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for obj in minio_client.list_objects(bucket_name, recursive=True):
+        with zipfile.ZipFile(out, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            objects = minio_client.list_objects(bucket_name, recursive=True)
+            while True:
+                # Keep a bounded window of downloads in flight ahead of the writer
+                for obj in objects:
+                    if previous is not None and obj.etag and previous_etags.get(obj.object_name) == obj.etag:
+                        # Unchanged since the previous backup, copied from there when its turn comes
+                        pending.append((obj, None))
+                        continue
+                    pending.append((obj, executor.submit(download_minio_object, minio_client, bucket_name, obj.object_name)))
+                    if len(pending) >= MINIO_BACKUP_CONCURRENCY * 2:
+                        break
+                if not pending:
+                    break
+                if cancelled.is_set():
+                    raise BackupCancelled()
+                
+                obj, future = pending.popleft()
                 try:
-                    data = minio_client.get_object(bucket_name, obj.object_name)
-                    zipf.writestr(obj.object_name, data.read())
-                    data.close()  # Close the MinIO object
+                    info = zipfile.ZipInfo(obj.object_name, time.localtime(time.time())[:6])
+                    info.compress_type = minio_compress_type(obj.object_name)
+                    # Public as ZipInfo.compress_level from Python 3.13, the private name works on both
+                    info._compresslevel = MINIO_BACKUP_COMPRESSLEVEL
+                    info.external_attr = 0o600 << 16
+                    info.file_size = obj.size
+                    source = previous.open(obj.object_name) if future is None else future.result()
+                    with source, zipf.open(info, 'w') as dest:
+                        shutil.copyfileobj(source, dest, COPY_CHUNK_SIZE)
+                    etags[obj.object_name] = obj.etag
                 except Exception as e:
-                    print(f"Error backing up {obj.object_name}: {str(e)}")
+                    logger.error("Error backing up %s: %s", obj.object_name, e)
                     raise e
-        
-        # Read the zip file contents
-        with open(temp_path, 'rb') as f:
-            backup_data = f.read()
-        
-        return backup_data
-    
+        return etags
+    except BackupCancelled:
+        raise
     except Exception as e:
-        print(f"Error in MinIO backup: {str(e)}")
+        logger.error("Error in MinIO backup: %s", e)
         raise e
-    
     finally:
-        # Clean up the temporary file
+        # Drop queued downloads, wait for running ones and release those that were not written
+        executor.shutdown(wait=True, cancel_futures=True)
+        for _, future in pending:
+            if future is not None and not future.cancelled() and future.exception() is None:
+                future.result().close()
+
+class BackupArchive:
+    """
+    Backup ZIP file written front to back in a single pass and hashed as it is written,
+    so the checksum of the whole file is known without reading it back.
+    When size_hint is given the file is preallocated, so the filesystem can reserve
+    contiguous space up front instead of growing the file a write at a time
+    """
+    def __init__(self, path: str, size_hint: int = 0):
+        self.path = path
+        self.file = open(path, 'wb', buffering=BACKUP_WRITE_BUFFER_SIZE)
+        if size_hint and hasattr(os, 'posix_fallocate'):
+            try:
+                os.posix_fallocate(self.file.fileno(), 0, size_hint)
+            except OSError:
+                # Not supported by every filesystem, the file then grows as usual
+                pass
+        self.writer = HashingWriter(self.file)
+        # The writer cannot seek, so zipfile records member sizes after the data
+        # instead of going back to patch the headers it already wrote
+        self.zipf = zipfile.ZipFile(self.writer, 'w', zipfile.ZIP_STORED)
+
+    def close(self) -> str:
+        """Finish the ZIP file and return the SHA-256 checksum of the whole file"""
+        try:
+            self.zipf.close()
+            # Drop whatever preallocated space was not used
+            self.file.truncate()
+        finally:
+            self.file.close()
+        return self.writer.hexdigest()
+
+    def discard(self) -> None:
+        """Close and remove an unfinished ZIP file"""
         try:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-        except Exception as e:
-            print(f"Warning: Could not delete temporary file {temp_path}: {str(e)}")
+            self.zipf.close()
+        except Exception:
+            # A member may still be open for writing, the file is removed anyway
+            pass
+        finally:
+            self.file.close()
+            os.remove(self.path)
 
-async def create_backup_zip(mongo_data: bytes, minio_data: bytes) -> Tuple[io.BytesIO, str, str, str]:
+def open_previous_minio_backup(stack: ExitStack, previous_path: Optional[str]) -> Tuple[Optional[zipfile.ZipFile], Dict[str, str]]:
     """
-    Create a ZIP file containing all backup data and checksums.
-    Returns the zip buffer, mongo_checksum, minio_checksum, and combined_checksum.
+    Open the MinIO backup zip inside a previous backup file along with the object ETags it was made from.
+    Returns (None, {}) when there is no usable previous backup. Everything opened is closed with stack
     """
-    # Calculate checksums
-    mongo_checksum = await calculate_checksum(mongo_data)
-    minio_checksum = await calculate_checksum(minio_data)
-    combined_checksum = await calculate_checksum(mongo_checksum.encode() + minio_checksum.encode())
-    
-    # Create zip file with NO compression to ensure binary consistency
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_STORED) as zipf:
-        # Set fixed timestamps for all files (Jan 1, 2025)
-        fixed_date = (2025, 1, 1, 0, 0, 0)
-        
-        # Create a ZipInfo object for each file with fixed metadata
-        mongo_info = zipfile.ZipInfo(MONGODB_BACKUP_FILENAME, fixed_date)
-        minio_info = zipfile.ZipInfo(MINIO_BACKUP_FILENAME, fixed_date)
-        checksum_info = zipfile.ZipInfo(CHECKSUMS_FILENAME, fixed_date)
-        
-        # Write the files using ZipInfo to control all metadata
-        zipf.writestr(mongo_info, mongo_data)
-        zipf.writestr(minio_info, minio_data)
+    if not previous_path or not os.path.exists(previous_path):
+        return None, {}
+    try:
+        outer = stack.enter_context(zipfile.ZipFile(previous_path))
+        if MINIO_MANIFEST_FILENAME not in outer.namelist():
+            return None, {}
+        etags = orjson.loads(outer.read(MINIO_MANIFEST_FILENAME))
+        # Stored members can be seeked, so the inner zip is read in place without extracting it
+        inner = stack.enter_context(zipfile.ZipFile(stack.enter_context(outer.open(MINIO_BACKUP_FILENAME))))
+        return inner, etags
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+        logger.info("Not reusing previous MinIO backup: %s", e)
+        return None, {}
 
-        # Include the checksums in a metadata file
-        metadata = {
-            "mongo_checksum": mongo_checksum,
-            "minio_checksum": minio_checksum,
-            "combined_checksum": combined_checksum,
-        }
+def start_backup_zip(minio_client: Minio, cancelled: threading.Event, dest_path: str, previous_path: Optional[str] = None) -> Tuple[BackupArchive, str]:
+    """
+    Start the backup ZIP file at dest_path with the zipped MinIO bucket as its first member,
+    meant to run in a worker thread. The MinIO zip is streamed straight into the backup and
+    hashed on the way, so it is never buffered or read back. Objects unchanged since the
+    backup at previous_path are copied from it, and the ETags of this backup are stored
+    alongside for the next one.
+    Returns the open archive and the MinIO backup's SHA-256 checksum.
+    If the backup fails or is cancelled the partial file is removed
+    """
+    # The new backup is usually close in size to the previous one
+    size_hint = os.path.getsize(previous_path) if previous_path and os.path.exists(previous_path) else 0
+    archive = BackupArchive(dest_path, size_hint)
+    try:
+        with ExitStack() as stack:
+            previous, previous_etags = open_previous_minio_backup(stack, previous_path)
+            info = zipfile.ZipInfo(MINIO_BACKUP_FILENAME, BACKUP_ENTRY_DATE)
+            # The size is only known once the bucket is zipped
+            with archive.zipf.open(info, 'w', force_zip64=True) as dest:
+                writer = HashingWriter(dest)
+                etags = write_minio_backup(minio_client, cancelled, writer, previous, previous_etags)
+        archive.zipf.writestr(zipfile.ZipInfo(MINIO_MANIFEST_FILENAME, BACKUP_ENTRY_DATE), orjson.dumps(etags))
+        return archive, writer.hexdigest()
+    except BaseException:
+        archive.discard()
+        raise
 
-        # Use a deterministic JSON format (sorted keys, no whitespace)
-        json_data = json.dumps(metadata, sort_keys=True, separators=(',', ':'))
-        zipf.writestr(checksum_info, json_data.encode('utf-8'))
-    
-    zip_buffer.seek(0)
-    return zip_buffer, mongo_checksum, minio_checksum, combined_checksum
+async def backup_minio(minio_client: Minio, dest_path: str, previous_path: Optional[str] = None) -> Tuple[BackupArchive, str]:
+    """
+    Start the backup ZIP file at dest_path with the MinIO bucket contents without blocking the event loop.
+    Returns the open archive, which the caller must finish or discard, and the checksum of the MinIO backup
+    """
+    cancelled = threading.Event()
+    future = asyncio.ensure_future(
+        asyncio.to_thread(start_backup_zip, minio_client, cancelled, dest_path, previous_path)
+    )
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        # The thread may already have returned an open archive, or may still return one
+        # after missing the cancellation, so whatever it produces is discarded here
+        future.add_done_callback(discard_unused_minio_backup)
+        raise
+    finally:
+        # If this coroutine is cancelled (timeout, or the backup is not needed)
+        # let the worker thread stop instead of zipping the rest of the bucket
+        cancelled.set()
+
+def discard_unused_minio_backup(future: asyncio.Future) -> None:
+    """Discard the partial backup archive of a MinIO backup future whose result was not used"""
+    if not future.cancelled() and future.exception() is None:
+        archive, _ = future.result()
+        archive.discard()
+
+def finish_backup_zip(archive: BackupArchive, mongo_file: BinaryIO, mongo_checksum: str, minio_checksum: str, combined_checksum: str) -> str:
+    """
+    Add the MongoDB backup and the checksums to the backup archive started by start_backup_zip and close it.
+    The MongoDB backup is copied from its file in chunks, so it is not loaded into memory.
+    Returns the SHA-256 checksum of the whole backup file
+    """
+    # Stored with NO compression to ensure binary consistency
+    zipf = archive.zipf
+    info = zipfile.ZipInfo(MONGODB_BACKUP_FILENAME, BACKUP_ENTRY_DATE)
+    mongo_file.seek(0, os.SEEK_END)
+    info.file_size = mongo_file.tell()
+    mongo_file.seek(0)
+    with zipf.open(info, 'w') as dest:
+        shutil.copyfileobj(mongo_file, dest, COPY_CHUNK_SIZE)
+
+    # Include the checksums in a metadata file
+    metadata = {
+        "mongo_checksum": mongo_checksum,
+        "minio_checksum": minio_checksum,
+        "combined_checksum": combined_checksum,
+    }
+
+    # Use a deterministic JSON format (sorted keys, no whitespace)
+    json_data = orjson.dumps(metadata, option=orjson.OPT_SORT_KEYS)
+    zipf.writestr(zipfile.ZipInfo(CHECKSUMS_FILENAME, BACKUP_ENTRY_DATE), json_data)
+    return archive.close()
+
+def write_checksum_file(backup_path: str, checksum: str) -> None:
+    """Write the backup file's checksum next to it, in sha256sum format"""
+    with open(f"{backup_path}.sha256", 'w') as f:
+        f.write(f"{checksum}  {os.path.basename(backup_path)}\n")
+
+def read_checksum_file(backup_path: str) -> Optional[str]:
+    """Read the checksum written next to a backup file, if there is one"""
+    try:
+        with open(f"{backup_path}.sha256") as f:
+            return f.read().split(maxsplit=1)[0]
+    except (OSError, IndexError):
+        return None
 
 # ----- Verification Operations -----
 
-async def extract_checksums_from_zip(content_bytes: bytes) -> Dict[str, str]:
+def open_backup_zip(file: BinaryIO) -> Optional[zipfile.ZipFile]:
+    """
+    Open a backup file as a ZIP file, or return None if it is not one.
+    Only the central directory at the end of the file is read
+    """
+    file.seek(0)
+    try:
+        return zipfile.ZipFile(file)
+    except zipfile.BadZipFile:
+        return None
+
+def extract_checksums_from_zip(zipf: zipfile.ZipFile) -> Dict[str, str]:
     """Extract checksums from a backup ZIP file"""
     try:
-        with zipfile.ZipFile(io.BytesIO(content_bytes)) as zipf:
-            if CHECKSUMS_FILENAME in zipf.namelist():
-                metadata = json.loads(zipf.read(CHECKSUMS_FILENAME).decode('utf-8'))
-                return {
-                    "mongo_checksum": metadata.get('mongo_checksum'),
-                    "minio_checksum": metadata.get('minio_checksum'),
-                    "combined_checksum": metadata.get('combined_checksum')
-                }
+        if CHECKSUMS_FILENAME in zipf.namelist():
+            metadata = orjson.loads(zipf.read(CHECKSUMS_FILENAME))
+            return {
+                "mongo_checksum": metadata.get('mongo_checksum'),
+                "minio_checksum": metadata.get('minio_checksum'),
+                "combined_checksum": metadata.get('combined_checksum')
+            }
     except (KeyError, zipfile.BadZipFile):
         # These are expected cases when the file isn't a zip or doesn't contain checksums
         return {}
     except Exception as e:
         # Only print unexpected errors
-        print(f"Unexpected error extracting checksums: {str(e)}")
+        logger.error("Unexpected error extracting checksums: %s", e)
         return {}
 
+def file_checksum(file: BinaryIO) -> str:
+    """Calculate the SHA-256 checksum of a whole file object, reading it in chunks"""
+    file.seek(0)
+    return hashlib.file_digest(file, "sha256").hexdigest()
+
+def member_checksum(zipf: zipfile.ZipFile, name: str) -> str:
+    """Calculate the SHA-256 checksum of a ZIP member while decompressing it in chunks"""
+    with zipf.open(name) as member:
+        return hashlib.file_digest(member, "sha256").hexdigest()
+
 async def verify_zip_contents(zipf, expected_checksums: Dict[str, str]) -> Dict[str, Any]:
     """Verify the contents of a backup ZIP file against expected checksums"""
     try:
-        # Verify MongoDB backup
-        mongo_data = zipf.read(MONGODB_BACKUP_FILENAME)
-        mongo_checksum = await calculate_checksum(mongo_data)
+        # Hash both payloads at once on separate threads. hashlib releases the GIL while
+        # hashing and zipfile serializes the underlying reads, so the two run on separate cores
+        mongo_checksum, minio_checksum = await asyncio.gather(
+            asyncio.to_thread(member_checksum, zipf, MONGODB_BACKUP_FILENAME),
+            asyncio.to_thread(member_checksum, zipf, MINIO_BACKUP_FILENAME)
+        )
         
+        # Verify MongoDB backup
         if mongo_checksum != expected_checksums.get("mongo_checksum"):
             return {
                 "status": "failed",
@@ -261,9 +577,6 @@ async def verify_zip_contents(zipf, expected_checksums: Dict[str, str]) -> Dict[
             }
         
         # If MongoDB checksum matches, verify MinIO
-        minio_data = zipf.read(MINIO_BACKUP_FILENAME)
-        minio_checksum = await calculate_checksum(minio_data)
-        
         if minio_checksum != expected_checksums.get("minio_checksum"):
             return {
                 "status": "failed",
@@ -273,7 +586,7 @@ async def verify_zip_contents(zipf, expected_checksums: Dict[str, str]) -> Dict[
             }
         
         # Calculate combined checksum
-        combined_checksum = await calculate_checksum(mongo_checksum.encode() + minio_checksum.encode())
+        combined_checksum = calculate_checksum(mongo_checksum.encode() + minio_checksum.encode())
         
         if expected_checksums.get("combined_checksum") and combined_checksum != expected_checksums.get("combined_checksum"):
             return {
@@ -301,6 +614,20 @@ async def verify_zip_contents(zipf, expected_checksums: Dict[str, str]) -> Dict[
 
 # ----- Route Handlers -----
 
+async def previous_backup_response(last_backup: Dict[str, Any], previous_path: str, previous_filename: str) -> FileResponse:
+    """Stream the existing backup file from disk with its checksum headers"""
+    headers = {"X-Backup-Checksum": last_backup.get("combined_checksum")}
+    file_checksum = await asyncio.to_thread(read_checksum_file, previous_path)
+    if file_checksum:
+        headers["X-Backup-File-Checksum"] = file_checksum
+    
+    return FileResponse(
+        previous_path,
+        media_type="application/zip",
+        filename=previous_filename,
+        headers=headers
+    )
+
 @router.get("/", response_description="Create and download a complete backup")
 async def create_backup(
     background_tasks: BackgroundTasks,
@@ -308,65 +635,63 @@ async def create_backup(
     db = Depends(get_db),
     minio_client: Minio = Depends(get_object_storage)
 ):
+    # Get last backup checksums
+    last_backup = await db.backups.find_one({}, sort=[("timestamp", -1)])
+    previous_path, previous_filename = resolve_backup_path(last_backup.get("relative_path") if last_backup else None)
+    
+    # If the oplog shows no writes since the previous backup was dumped, reuse it without dumping again
+    previous_exists = bool(previous_path) and os.path.exists(previous_path)
+    if previous_exists and await mongodb_unchanged_since(db, last_backup.get("change_tag")):
+        return await previous_backup_response(last_backup, previous_path, previous_filename)
+    # Read before the dump starts, so the dump contains every write up to it
+    change_tag = await get_change_tag(db)
+    
+    # The MinIO backup is independent of the database dump, so start the new backup
+    # file with it right away and drop it if the previous backup turns out to be reusable.
+    # Objects unchanged since the previous backup are copied from it instead of MinIO
+    backup_filename, absolute_path, relative_path = generate_backup_paths()
+    partial_path = f"{absolute_path}.partial"
+    os.makedirs(settings.BACKUP_DIR, exist_ok=True)
+    minio_task = asyncio.create_task(
+        execute_with_timeout(backup_minio(minio_client, partial_path, previous_path), timeout)
+    )
+    completed = False
+    mongo_file = tempfile.TemporaryFile()
     try:
-        # Get last backup checksums
-        last_backup = await db.backups.find_one({}, sort=[("timestamp", -1)])
-        
         # Create the MongoDB backup (excluding the backups collection)
-        mongo_data = await execute_with_timeout(backup_mongodb(db), timeout)
-        mongo_checksum = await calculate_checksum(mongo_data)
+        mongo_writer = HashingWriter(mongo_file)
+        await execute_with_timeout(backup_mongodb(db, mongo_writer), timeout)
+        mongo_checksum = mongo_writer.hexdigest()
         
         # Check if MongoDB has changed
         if last_backup and mongo_checksum == last_backup.get("mongo_checksum"):
             # MongoDB hasn't changed, use the previous backup
-            stored_path = last_backup.get("relative_path")
-            absolute_path, backup_filename = resolve_backup_path(stored_path)
-            
-            if absolute_path and os.path.exists(absolute_path):
-                # Read the existing backup file
-                with open(absolute_path, 'rb') as f:
-                    backup_data = f.read()
-                
-                return StreamingResponse(
-                    io.BytesIO(backup_data),
-                    media_type="application/zip",
-                    headers={
-                        "Content-Disposition": f"attachment; filename={backup_filename}",
-                        "Content-Length": str(len(backup_data)),
-                        "X-Backup-Checksum": last_backup.get("combined_checksum")
-                    }
-                )
+            if previous_exists:
+                return await previous_backup_response(last_backup, previous_path, previous_filename)
         
         # If we get here, we need to create a new backup
-        backup_filename, absolute_path, relative_path = generate_backup_paths()
-        
-        minio_data = await execute_with_timeout(backup_minio(minio_client), timeout)
-        minio_checksum = await calculate_checksum(minio_data)
-        combined_checksum = await calculate_checksum(mongo_checksum.encode() + minio_checksum.encode())
-        
-        # Create zip file with fixed metadata
-        zip_buffer, _, _, combined_checksum = await create_backup_zip(mongo_data, minio_data)
-        zip_size = len(zip_buffer.getvalue())
-        zip_buffer.seek(0)
+        archive, minio_checksum = await minio_task
+        combined_checksum = calculate_checksum(mongo_checksum.encode() + minio_checksum.encode())
         
-        # Ensure backup directory exists and store the backup file
-        os.makedirs(settings.BACKUP_DIR, exist_ok=True)
-        with open(absolute_path, 'wb') as f:
-            f.write(zip_buffer.getvalue())
+        # Complete the backup file with fixed metadata and only then give it its final name.
+        # Its checksum is computed while writing and kept next to it for later downloads
+        file_checksum = await asyncio.to_thread(
+            finish_backup_zip, archive, mongo_file, mongo_checksum, minio_checksum, combined_checksum
+        )
+        os.replace(partial_path, absolute_path)
+        completed = True
+        await asyncio.to_thread(write_checksum_file, absolute_path, file_checksum)
         
         # Store new backup info with relative path and absolute path
         background_tasks.add_task(
-            store_backup_info, db, mongo_checksum, minio_checksum, combined_checksum, relative_path, absolute_path
+            store_backup_info, db, mongo_checksum, minio_checksum, combined_checksum, relative_path, absolute_path, change_tag
         )
         
-        return StreamingResponse(
-            zip_buffer,
+        return FileResponse(
+            absolute_path,
             media_type="application/zip",
-            headers={
-                "Content-Disposition": f"attachment; filename={backup_filename}",
-                "Content-Length": str(zip_size),
-                "X-Backup-Checksum": combined_checksum
-            }
+            filename=backup_filename,
+            headers={"X-Backup-Checksum": combined_checksum, "X-Backup-File-Checksum": file_checksum}
         )
     
     except Exception as e:
@@ -374,6 +699,11 @@ async def create_backup(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error creating backup: {str(e)}"
         )
+    finally:
+        mongo_file.close()
+        if not completed:
+            minio_task.cancel()
+            minio_task.add_done_callback(discard_unused_minio_backup)
 
 @router.post("/verify", response_description="Verify a backup file")
 async def verify_backup(
@@ -392,23 +722,18 @@ async def verify_backup(
     verify the actual file contents.
     """
     try:
-        # Read initial portion of the file to extract checksums
-        content_bytes = await backup_file.read(1024 * 1024)  # Read first MB
-        
-        # Try to extract checksums from the first MB
-        checksums = await extract_checksums_from_zip(content_bytes)
+        # The upload is already spooled by the form parser, so work on its file
+        # directly instead of reading the whole backup into memory
+        upload = backup_file.file
         
-        # If checksums not found in first MB, read more data
-        if not checksums:
-            # Reset position and read the whole file
-            await backup_file.seek(0)
-            full_content = await backup_file.read()
-            
-            checksums = await extract_checksums_from_zip(full_content)
+        # Parse the ZIP directory once for both the checksums and the full verification
+        zipf = await asyncio.to_thread(open_backup_zip, upload)
+        try:
+            checksums = await asyncio.to_thread(extract_checksums_from_zip, zipf) if zipf else {}
             
-            # If still no checksums, verify whole file
+            # If there are no checksums, verify the whole file
             if not checksums:
-                actual_checksum = await calculate_checksum(full_content)
+                actual_checksum = await asyncio.to_thread(file_checksum, upload)
                 
                 if expected_checksum and actual_checksum != expected_checksum:
                     return {
@@ -423,38 +748,40 @@ async def verify_backup(
                     "message": "Backup verification successful (whole file)",
                     "checksum": actual_checksum
                 }
-        
-        # If expected_checksum is provided, verify against it first
-        if expected_checksum:
-            if checksums.get("combined_checksum") and checksums["combined_checksum"] != expected_checksum:
-                return {
-                    "status": "failed",
-                    "message": "Checksum mismatch (checked against expected checksum)",
-                    "expected": expected_checksum,
-                    "actual": checksums["combined_checksum"]
-                }
-        
-        # Quick verification using stored checksums if possible
-        if quick_verify:
-            existing_backup = await get_backup_by_mongo_checksum(db, checksums.get("mongo_checksum", ""))
             
-            if existing_backup and existing_backup.get("combined_checksum") == checksums.get("combined_checksum"):
-                # No need to create a new record, just return success
-                return {
-                    "status": "success",
-                    "message": "Backup verification successful (using fast verification)",
-                    "checksum": checksums.get("combined_checksum")
-                }
-        
-        # Need to verify by reading actual content
-        await backup_file.seek(0)
-        full_content = await backup_file.read()
-        
-        with zipfile.ZipFile(io.BytesIO(full_content)) as zipf:
+            # If expected_checksum is provided, verify against it first
+            if expected_checksum:
+                if checksums.get("combined_checksum") and checksums["combined_checksum"] != expected_checksum:
+                    return {
+                        "status": "failed",
+                        "message": "Checksum mismatch (checked against expected checksum)",
+                        "expected": expected_checksum,
+                        "actual": checksums["combined_checksum"]
+                    }
+            
+            # Quick verification using stored checksums if possible
+            checksums_key = (checksums.get("mongo_checksum"), checksums.get("minio_checksum"), checksums.get("combined_checksum"))
+            if quick_verify:
+                verified = verified_backups_cache.get(checksums_key, False)
+                if not verified:
+                    existing_backup = await get_backup_by_mongo_checksum(db, checksums.get("mongo_checksum", ""))
+                    verified = bool(existing_backup) and existing_backup.get("combined_checksum") == checksums.get("combined_checksum")
+                
+                if verified:
+                    verified_backups_cache.set(checksums_key, True)
+                    # No need to create a new record, just return success
+                    return {
+                        "status": "success",
+                        "message": "Backup verification successful (using fast verification)",
+                        "checksum": checksums.get("combined_checksum")
+                    }
+            
+            # Need to verify by reading actual content, one member at a time
             verification_result = await verify_zip_contents(zipf, checksums)
             
             # Only store new backup info if this is a new backup (not found in quick verify)
             if verification_result["status"] == "success":
+                verified_backups_cache.set(checksums_key, True)
                 _, absolute_path, relative_path = generate_backup_paths()
                 
                 # Double check we don't already have this backup
@@ -471,6 +798,9 @@ async def verify_backup(
                     )
             
             return verification_result
+        finally:
+            if zipf:
+                zipf.close()
     
     except zipfile.BadZipFile:
         raise HTTPException(
@@ -1,13 +1,21 @@
 from fastapi import APIRouter, HTTPException, Response, status, Depends
 from typing import List
+from pydantic import TypeAdapter
 from models.models import CategoryResponse, ensure_object_id, prepare_mongo_document, CategoryInDB, CategoryCreate, CategoryUpdate
 from db.schemas.users_schema import UserInDB
 from dependencies.auth import get_admin_user
 from pymongo import ReturnDocument
 from db.db import get_db
+from utils.cache import TTLCache
+from routes.articles import invalidate_article_caches
 
 router = APIRouter()
 
+# Serialized category list. Categories rarely change, so the body is built
+# once and dropped whenever a category is created, updated or deleted
+categories_cache = TTLCache(maxsize=1, ttl=300)
+category_list_adapter = TypeAdapter(List[CategoryResponse])
+
 @router.post("/", response_model=CategoryInDB)
 async def create_category(
     category: CategoryCreate,
@@ -21,25 +29,30 @@ async def create_category(
             detail="Category with this slug already exists"
         )
     
-    category_dict = category.dict()
+    category_dict = category.model_dump()
     result = await db.categories.insert_one(category_dict)
     
     created_category = await db.categories.find_one({"_id": result.inserted_id})
+    categories_cache.invalidate()
     return prepare_mongo_document(created_category)
 
 @router.get("/", response_model=List[CategoryResponse])
 async def read_categories(db=Depends(get_db)):
-    categories = []
-    cursor = db.categories.find({})
-    async for document in cursor:
-        categories.append(prepare_mongo_document(document)) # Append each document to the list
-    return categories
+    async def build_categories():
+        categories = []
+        cursor = db.categories.find({})
+        async for document in cursor:
+            categories.append(prepare_mongo_document(document)) # Append each document to the list
+        # Serialize through the response model so the cached body matches what FastAPI would send
+        return category_list_adapter.dump_json(category_list_adapter.validate_python(categories))
+
+    content = await categories_cache.get_or_set("all", build_categories)
+    return Response(content=content, media_type="application/json")
     # return prepare_mongo_document(categories)
 
 @router.get("/{category_id}", response_model=CategoryResponse)
 async def read_category(category_id: str, db = Depends(get_db)):
     try:
-        from models.models import ensure_object_id
         object_id = ensure_object_id(category_id)
         # object_id = PyObjectId(category_id)
 
@@ -48,7 +61,8 @@ async def read_category(category_id: str, db = Depends(get_db)):
         if category:
             return prepare_mongo_document(category)
         raise HTTPException(status_code=404, detail="Category not found")
-    except:
+    except ValueError:
+        # Only a malformed ID is reported as such, database errors are not masked
         raise HTTPException(status_code=400, detail="Invalid category ID")
 
 @router.put("/{category_id}", response_model=CategoryInDB)
@@ -73,7 +87,7 @@ async def update_category(
                     detail="Category with this slug already exists"
                 )
         
-        update_data = {k: v for k, v in category_update.dict(exclude_unset=True).items() if v is not None}
+        update_data = category_update.model_dump(exclude_unset=True, exclude_none=True)
         
         if update_data:
             updated_category = await db.categories.find_one_and_update(
@@ -83,19 +97,17 @@ async def update_category(
             )
             
             if updated_category:
-                # If category name or slug changed, update all articles with this category
-                if "name" in update_data or "slug" in update_data:
-                    await db.articles.update_many(
-                        {"category._id": str(object_id)},
-                        {"$set": {
-                            "category.name": updated_category.get("name"),
-                            "category.slug": updated_category.get("slug")
-                        }}
-                    )
+                # Articles only store category_id and look the category up when read,
+                # so there are no copies of the name or slug to update, only cached responses
+                categories_cache.invalidate()
+                invalidate_article_caches()
                 
                 return prepare_mongo_document(updated_category)
         
         raise HTTPException(status_code=404, detail="Category not found")
+    except HTTPException:
+        # Re-raise HTTP exceptions to preserve status code and detail
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Invalid category ID - {e}")
 
@@ -109,7 +121,7 @@ async def delete_category(
         object_id = ensure_object_id(category_id)
         
         # Check if category has articles
-        article_count = await db.articles.count_documents({"category._id": str(object_id)})
+        article_count = await db.articles.count_documents({"category_id": object_id})
         if article_count > 0:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -121,6 +133,9 @@ async def delete_category(
         if delete_result.deleted_count == 0:
             raise HTTPException(status_code=404, detail="Category not found")
         
+        categories_cache.invalidate()
         return Response(status_code=status.HTTP_204_NO_CONTENT)
-    except:
+    except ValueError:
+        # Only a malformed ID is reported as such, the 400 for a category
+        # still in use and the 404 above keep their own status and detail
         raise HTTPException(status_code=400, detail="Invalid category ID")
\ No newline at end of file
@@ -52,7 +52,7 @@ async def update_auto_publish_setting(
     try:
         updated_settings = await settings_repo.update_settings(
             AppSettingsUpdate(auto_publish_articles=auto_publish),
-            str(current_user.id)
+            current_user.id_str
         )
         return updated_settings
     except Exception as e:
@@ -1,16 +1,30 @@
-from typing import Optional
+from typing import Iterator, Optional
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
 from dependencies.auth import CurrentActiveUser, AdminUser, OptionalUser, get_current_user_optional, get_current_active_user
 from fastapi.responses import Response, StreamingResponse
 from fastapi.requests import Request
 from minio import Minio
 from db.db import get_object_storage, get_db
-import io
+from services.minio_service import create_slug, generate_unique_file_id, upload_to_minio
+import asyncio
 from config import settings
 import os
 
 router = APIRouter()
 
+STREAM_CHUNK_SIZE = 256 * 1024  # Bytes sent at a time when streaming a file from MinIO
+
+def iter_minio_object(response, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yield a MinIO object's body in chunks, releasing the connection once it is consumed.
+    Starlette runs this blocking iterator in its thread pool
+    """
+    try:
+        yield from response.stream(chunk_size)
+    finally:
+        response.close()
+        response.release_conn()
+
 @router.get("/files/{file_id_or_slug}")
 async def get_file(
     request: Request,
@@ -58,25 +72,24 @@ async def get_file(
             object_name = file["object_name"]
             bucket_name = settings.MINIO_BUCKET
             
-            # Get the object from MinIO
-            response = minio_client.get_object(bucket_name, object_name)
-
-            # Read the data from the response
-            file_data = io.BytesIO(response.read())
-
-            # Reset the pointer to the beginning of the BytesIO object
-            file_data.seek(0)
+            # Get the object from MinIO without blocking the event loop, the body is
+            # streamed to the client instead of being read into memory first
+            response = await asyncio.to_thread(minio_client.get_object, bucket_name, object_name)
             
             # Set up the content disposition based on whether it's a download
             content_disposition = f"attachment; filename=\"{file.get('filename', 'file')}\""
             if not download:
                 content_disposition = f"inline; filename=\"{file.get('filename', 'file')}\""
             
+            headers = {"Content-Disposition": content_disposition}
+            if "Content-Length" in response.headers:
+                headers["Content-Length"] = response.headers["Content-Length"]
+            
             # Return the file as a streaming response
             return StreamingResponse(
-                file_data,
+                iter_minio_object(response),
                 media_type=file.get("content_type", "application/octet-stream"),
-                headers={"Content-Disposition": content_disposition}
+                headers=headers
             )
             
         except Exception as e:
@@ -140,13 +153,11 @@ async def upload_image(
                 print(f"[Create Article] Processing image upload: {image.filename}")
                 
                 # Get MongoDB collection for file metadata
-                from db.db import get_db
                 mongo_collection = await get_db()
                 mongo_collection = mongo_collection.files
                 print(f"[Create Article] MongoDB collection retrieved: files")
                 
                 # Generate a unique file ID
-                from services.minio_service import generate_unique_file_id, create_slug
                 file_id = await generate_unique_file_id(mongo_collection)
                 print(f"[Create Article] Generated file_id: {file_id}")
                 
@@ -156,7 +167,6 @@ async def upload_image(
                 print(f"[Create Article] Storage folder path: {folder}")
                 
                 # Save the image to MinIO
-                from services.minio_service import upload_to_minio
                 file_data = await upload_to_minio(
                     data=await image.read(),
                     filename=image.filename,
@@ -180,7 +190,7 @@ async def upload_image(
                 file_data["slug"] = slug
                 
                 # Store file metadata in MongoDB with additional user_id
-                file_data["user_id"] = str(current_user.id)
+                file_data["user_id"] = current_user.id_str
                 print(f"[Create Article] File data: {file_data}")
                 # Save to database
                 result = await mongo_collection.insert_one(file_data)
@@ -200,7 +210,7 @@ async def upload_image(
                     "size": file_data["size"],
                     "object_name": file_data["object_name"],
                     "slug": file_data["slug"],
-                    "unique_string": file_data["file_id"].split("-")[0]  # First part of UUID
+                    "unique_string": file_data["unique_string"]  # First part of UUID, set by upload_to_minio
                 }
                 
             except Exception as e:
@@ -7,6 +7,7 @@ import io
 import uuid
 from typing import List, Optional, Tuple, Dict, Any
 from datetime import datetime, timedelta
+from utils.time import get_current_utc_time
 from pydantic import BaseModel, Field
 import motor.motor_asyncio
 import pymongo
@@ -212,7 +213,7 @@ async def save_file_to_minio(
         "object_name": object_name,
         "url": url,
         "slug": slug,
-        "uploaded_at": datetime.utcnow()
+        "uploaded_at": get_current_utc_time()
     }
     
     return file_data
@@ -525,7 +526,7 @@ async def create_article_test(
                     "size": file_data["size"],
                     "object_name": file_data["object_name"],
                     "slug": file_data["slug"],
-                    "unique_string": file_data["file_id"].split("-")[0]  # First part of UUID
+                    "unique_string": file_data["unique_string"]  # First part of UUID, set by upload_to_minio
                 }
                 
             except S3Error as err:
@@ -559,8 +560,8 @@ async def create_article_test(
             "read_time": read_time,
             "category_id": ObjectId(category_id),
             "author_id": ObjectId(user_id),
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow(),
+            "created_at": get_current_utc_time(),
+            "updated_at": get_current_utc_time(),
             "views": 0,
             "likes": 0,
             "comments": [],
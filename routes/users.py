@@ -10,16 +10,17 @@ from datetime import datetime
 
 from minio import Minio
 from pydantic import EmailStr
-from db.db import get_object_storage
+from db.db import get_db, get_object_storage
 from dependencies.user import UserServiceDep, get_user_service
 from models.models import get_current_utc_time
 
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from models.models import ArticleInDB, clean_document, ensure_object_id
 from models.users_model import UserCreate, UserUpdate
 from mappers.users_mapper import UserResponse
 from dependencies.auth import OptionalUser, AdminUser, CurrentActiveUser, get_current_active_user
 from services import minio_service
+from services.minio_service import create_slug, generate_unique_file_id, upload_profile_picture, upload_to_minio
 from services.user_service import UserService
 
 router = APIRouter()
@@ -57,7 +58,6 @@ async def create_user(
         # Handle profile picture upload if provided
         if profile_picture and profile_picture.filename:
             # Upload to MinIO and create file record
-            from services.minio_service import upload_profile_picture
             file_record = await upload_profile_picture(
                 profile_picture=profile_picture,
                 username=username,
@@ -96,7 +96,7 @@ async def read_users_me(
     """
     try:
         user_data = await user_service.get_user_profile(current_user.id)
-        return JSONResponse(content=user_data)
+        return ORJSONResponse(content=user_data)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Server error: {str(e)}")
 
@@ -148,13 +148,11 @@ async def update_user(
                 print(f"[Update User] Processing profile picture upload: {profile_picture.filename}")
                 
                 # Get MongoDB collection for file metadata
-                from db.db import get_db
                 mongo_collection = await get_db()
                 mongo_collection = mongo_collection.files
                 print(f"[Update User] MongoDB collection retrieved: files")
                 
                 # Generate a unique file ID
-                from services.minio_service import generate_unique_file_id
                 file_id = await generate_unique_file_id(mongo_collection)
                 print(f"[Update User] Generated file_id: {file_id}")
                 
@@ -163,7 +161,6 @@ async def update_user(
                 print(f"[Update User] Storage folder path: {folder}")
                 
                 # Save the image to MinIO
-                from services.minio_service import upload_to_minio
                 file_data = await upload_to_minio(
                     data=await profile_picture.read(),
                     filename=profile_picture.filename,
@@ -174,10 +171,9 @@ async def update_user(
                 print(f"[Update User] Image saved to MinIO: {file_data['object_name']}")
                 
                 # Store file metadata in MongoDB with additional user_id
-                file_data["user_id"] = str(current_user.id)
+                file_data["user_id"] = current_user.id_str
                 
                 # Generate slug for the file
-                from services.minio_service import create_slug
                 base_slug = await create_slug(os.path.splitext(profile_picture.filename)[0])
                 file_data["slug"] = f"{base_slug}-{file_data['unique_string']}"
                 
@@ -297,13 +293,11 @@ async def admin_update_user(
                 print(f"[Admin Update User] Processing profile picture upload: {profile_picture.filename}")
                 
                 # Get MongoDB collection for file metadata
-                from db.db import get_db
                 mongo_collection = await get_db()
                 mongo_collection = mongo_collection.files
                 print(f"[Admin Update User] MongoDB collection retrieved: files")
                 
                 # Generate a unique file ID
-                from services.minio_service import generate_unique_file_id
                 file_id = await generate_unique_file_id(mongo_collection)
                 print(f"[Admin Update User] Generated file_id: {file_id}")
                 
@@ -312,7 +306,6 @@ async def admin_update_user(
                 print(f"[Admin Update User] Storage folder path: {folder}")
                 
                 # Save the image to MinIO
-                from services.minio_service import upload_to_minio
                 file_data = await upload_to_minio(
                     data=await profile_picture.read(),
                     filename=profile_picture.filename,
@@ -326,7 +319,6 @@ async def admin_update_user(
                 file_data["user_id"] = str(user_id)
                 
                 # Generate slug for the file
-                from services.minio_service import create_slug
                 base_slug = await create_slug(os.path.splitext(profile_picture.filename)[0])
                 file_data["slug"] = f"{base_slug}-{file_data['unique_string']}"
                 
@@ -511,7 +503,7 @@ async def get_user_statistics(
                 # Check if current user is following this follower
                 is_following_follower = False
                 if current_user:
-                    current_user_object_id = ObjectId(str(current_user.id))
+                    current_user_object_id = ObjectId(current_user.id_str)
                     is_following_follower = current_user_object_id in [
                         ObjectId(str(f_id)) if not isinstance(f_id, ObjectId) else f_id 
                         for f_id in follower.get("followers", [])
@@ -536,7 +528,7 @@ async def get_user_statistics(
                 # Check if current user is following this user
                 is_following_user = False
                 if current_user:
-                    current_user_object_id = ObjectId(str(current_user.id))
+                    current_user_object_id = ObjectId(current_user.id_str)
                     is_following_user = current_user_object_id in [
                         ObjectId(str(f_id)) if not isinstance(f_id, ObjectId) else f_id 
                         for f_id in following_user.get("followers", [])
@@ -600,9 +592,9 @@ async def get_user_statistics(
         
         # Check if current user is following this user
         is_following = False
-        if current_user and str(current_user.id) != str(user["_id"]):
+        if current_user and current_user.id_str != str(user["_id"]):
             # Only perform this check if a current_user is provided and not viewing own profile
-            current_user_object_id = ObjectId(str(current_user.id))
+            current_user_object_id = ObjectId(current_user.id_str)
             is_following = current_user_object_id in [ObjectId(str(f_id)) for f_id in follower_ids]
         
         # Build response
@@ -627,7 +619,7 @@ async def get_user_statistics(
         
         # return user_stats
         serializable_response = clean_document(user_stats)
-        return JSONResponse(content=serializable_response)
+        return ORJSONResponse(content=serializable_response)
         
     except Exception as e:
         print(f"Error getting user statistics: {str(e)}")
@@ -663,7 +655,7 @@ async def bookmark_article(
         bookmark_ids = [ensure_object_id(str(_id)) for _id in bookmarks]
         
         # Convert the user ID to ObjectId for comparison
-        user_object_id = ensure_object_id(str(current_user.id))
+        user_object_id = ensure_object_id(current_user.id_str)
         
         # Check if article's bookmarked_by list exists and if user is already in it
         article_bookmarked_by = article.get('bookmarked_by', [])
@@ -676,7 +668,7 @@ async def bookmark_article(
         if not already_in_bookmarks and not already_in_bookmarked_by:
             # Update user's bookmarks list
             user_result = await db.users.update_one(
-                {"_id": ensure_object_id(str(current_user.id))},
+                {"_id": ensure_object_id(current_user.id_str)},
                 {"$addToSet": {"bookmarks": article_object_id}}
             )
             
@@ -708,7 +700,7 @@ async def bookmark_article(
             elif not already_in_bookmarks and already_in_bookmarked_by:
                 # Fix one-sided relationship by updating user's bookmarks
                 user_result = await db.users.update_one(
-                    {"_id": ensure_object_id(str(current_user.id))},
+                    {"_id": ensure_object_id(current_user.id_str)},
                     {"$addToSet": {"bookmarks": article_object_id}}
                 )
                 if user_result.modified_count:
@@ -747,7 +739,7 @@ async def delete_bookmark_article(
             raise HTTPException(status_code=404, detail="Article not found")
         
         # Ensure the user ID is properly converted to ObjectId
-        user_object_id = ensure_object_id(str(current_user.id))
+        user_object_id = ensure_object_id(current_user.id_str)
         
         # Convert current user's bookmarks list to ObjectId objects for comparison
         bookmark_ids = [ensure_object_id(str(_id)) for _id in current_user.bookmarks]
@@ -888,7 +880,7 @@ async def get_bookmarks(current_user: CurrentActiveUser, user_service: UserServi
         # Return the JSON response directly
         # Clean the entire response one more time to ensure all objects are serializable
         serializable_response = clean_document(bookmarked_articles)
-        return JSONResponse(content=serializable_response)
+        return ORJSONResponse(content=serializable_response)
     except Exception as e:
         print(f"Error in get_bookmarks: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
@@ -1,4 +1,7 @@
-from typing import Dict, List, Optional, Any
+import asyncio
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple
+from bson import ObjectId
 from utils.time import get_current_utc_time 
 from models.models import ArticleStatus, ensure_object_id
 from db.schemas.articles_schema import ArticleCreate, ArticleUpdate
@@ -9,6 +12,7 @@ from repos.article_repo import ArticleRepository
 from repos.user_repo import UserRepository
 from repos.category_repo import CategoryRepository
 from repos.settings_repo import SettingsRepository
+from logger.logger import logger
 
 class ArticleService:
     """
@@ -57,10 +61,11 @@ class ArticleService:
             
         return slug
     
-    async def create_article(self, article_data: ArticleCreate, author_id: str) -> Dict[str, Any]:
+    async def create_article(self, article_data: ArticleCreate, author_id: str, file_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Create a new article and return the created article.
         Articles are always created as drafts first.
+        If file_data is given, the image file metadata is stored together with the article.
         """
         try:
             # Validate category and author
@@ -87,7 +92,7 @@ class ArticleService:
             article_dict["status"] = "draft"
             
             # Create the article
-            created_article = await self.article_repo.create_article(article_dict)
+            created_article = await self.article_repo.create_article(article_dict, file_data)
             
             # Enrich article with related data
             enriched_article = await self.article_repo.enrich_article(created_article)
@@ -128,6 +133,30 @@ class ArticleService:
         except Exception as e:
             raise e
     
+    async def stream_articles(self,
+                              category: Optional[str] = None,
+                              author: Optional[str] = None,
+                              tag: Optional[str] = None,
+                              featured: Optional[bool] = None,
+                              article_status: Optional[ArticleStatus] = None,
+                              skip: int = 0,
+                              limit: int = 20,
+                              after: Optional[Tuple[datetime, ObjectId]] = None) -> Optional[AsyncIterator[Dict[str, Any]]]:
+        """
+        Get an async iterator over articles with optional filtering
+        after is an optional (created_at, _id) keyset cursor to page from
+        Returns None if the category or author does not exist
+        """
+        # Build query filter
+        query = await self.article_repo.build_query(
+            category, author, tag, featured, article_status
+        )
+        
+        if query is None:
+            return None  # No matching category or author
+        
+        return self.article_repo.iter_articles(query, skip, limit, after=after)
+    
     async def get_article_by_id_or_slug(self, id_or_slug: str, article_status: Optional[ArticleStatus] = None, current_user=None) -> Dict[str, Any]:
         """
         Get a single article by ID or slug
@@ -152,25 +181,27 @@ class ArticleService:
         Update an article if the user has permission
         """
         try:
-            print(f"Starting article update for article_id: {article_id}")
+            logger.debug("Starting article update for article_id: %s", article_id)
             
-            # Get the article
-            article = await self.article_repo.get_article_by_id(article_id)
+            # Get the article and the user whose permissions are checked
+            article, user_data = await asyncio.gather(
+                self.article_repo.get_article_by_id(article_id),
+                self.user_repo.get_user_by_id(current_user_id)
+            )
             if not article:
-                print(f"Article not found: {article_id}")
+                logger.debug("Article not found: %s", article_id)
                 return None
                 
             # Check permissions (admin or author)
-            user_data = await self.user_repo.get_user_by_id(current_user_id)
             if not user_data:
-                print(f"User not found: {current_user_id}")
+                logger.debug("User not found: %s", current_user_id)
                 return None
                 
             is_admin = user_data.user_type == "admin"
             is_author = str(article.get("author_id")) == current_user_id
             
             if not (is_admin or is_author):
-                print(f"User {current_user_id} does not have permission to update article {article_id}")
+                logger.debug("User %s does not have permission to update article %s", current_user_id, article_id)
                 return None  # Will be converted to 403 in the route
             
             # Prepare update data
@@ -180,16 +211,16 @@ class ArticleService:
                 if v is not None
             }
             
-            print(f"Update data: {update_data}")
+            logger.debug("Update data: %s", update_data)
             
             # If there's nothing to update, return the current article
             if not update_data:
-                print("No data to update, returning current article")
+                logger.debug("No data to update, returning current article")
                 return await self.article_repo.enrich_article(article)
             
             # If category_id is being updated, validate it
             if "category_id" in update_data and update_data["category_id"]:
-                print(f"Validating category_id: {update_data['category_id']}")
+                logger.debug("Validating category_id: %s", update_data["category_id"])
                 await self.category_repo.validate_category(update_data["category_id"])
                 update_data["category_id"] = ensure_object_id(update_data["category_id"])
             
@@ -197,20 +228,20 @@ class ArticleService:
             update_data["updated_at"] = get_current_utc_time()
             
             # Update the article
-            print("Updating article in database")
+            logger.debug("Updating article in database")
             updated_article = await self.article_repo.update_article(article_id, update_data)
             if not updated_article:
-                print(f"Failed to update article: {article_id}")
+                logger.debug("Failed to update article: %s", article_id)
                 return None
             
             # Enrich and return
-            print("Enriching updated article")
+            logger.debug("Enriching updated article")
             enriched_article = await self.article_repo.enrich_article(updated_article)
-            print(f"Successfully updated article: {article_id}")
+            logger.debug("Successfully updated article: %s", article_id)
             return enriched_article
             
         except Exception as e:
-            print(f"Error in update_article: {str(e)}")
+            logger.exception("update_article failed")
             raise Exception(f"Error updating article: {str(e)}")
     
     async def get_home_page_articles(self, get_optional_current_user=None) -> Dict[str, Any]:
@@ -297,7 +328,7 @@ class ArticleService:
             raise e
         except Exception as e:
             # Log the error and raise a more specific exception
-            print(f"Error in request_article_publish: {str(e)}")
+            logger.exception("request_article_publish failed")
             raise Exception(f"Error requesting article publish: {str(e)}")
     
     async def delete_article(self, article_id: str, current_user_id: str, current_user_type: str) -> bool:
@@ -371,6 +402,19 @@ class ArticleService:
         except Exception as e:
             raise e     
    
+    async def get_articles_likes_bulk(self, article_ids: List[str], user_id: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get like counts (and optionally the user's like flag) for several articles at once
+        Returns a dict keyed by article ID
+        """
+        try:
+            if not article_ids:
+                return {}
+            return await self.article_repo.get_articles_likes_bulk(article_ids, user_id)
+            
+        except Exception as e:
+            raise e
+   
     async def get_article_likes_users(self, article_id: str) -> List[str]:
         """
         Get the list of user IDs who liked an article
@@ -1,4 +1,4 @@
-from fastapi import HTTPException, status
+from fastapi import BackgroundTasks, HTTPException, status
 from typing import Dict, Optional, Any
 from datetime import datetime, timezone, timedelta
 import jwt
@@ -22,10 +22,11 @@ class AuthService:
     def __init__(self, user_repository: UserRepository):
         self.user_repo = user_repository
     
-    async def generate_user_token(self, username: str, password: str) -> Token:
+    async def generate_user_token(self, username: str, password: str, background_tasks: Optional[BackgroundTasks] = None) -> Token:
         """
         Authenticate a user with username and password
         Returns user token if authentication succeeds, None otherwise
+        The last login time is recorded after the response when background_tasks is given
         """
         # Find user by username
         user_db = await self.user_repo.find_by_username(username)
@@ -51,15 +52,19 @@ class AuthService:
             TokenData(
                 username=user_db.username,
                 user_id=user_db.id,
-                user_type=user_db.user_type
+                user_type=user_db.user_type,
+                token_version=user_db.token_version
             ),
             expires_delta=access_token_expires
         )
 
         # TODO: add refresh token
 
-        # Update last login time
-        await self.update_last_login(user_db.id)
+        # Update last login time, it is advisory so it does not need to hold up the login
+        if background_tasks is not None:
+            background_tasks.add_task(self.update_last_login, user_db.id)
+        else:
+            await self.update_last_login(user_db.id)
 
         print("user info retrieved: ", user_db)
         print("file info retrieved: ", user_db.profile_file)
@@ -84,6 +89,7 @@ class AuthService:
             "sub": data.username, 
             "id": data.user_id, 
             "type": data.user_type,
+            "ver": data.token_version,
             "exp": expire
         }
         encoded_jwt = jwt.encode(token_data, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
@@ -91,5 +97,4 @@ class AuthService:
     
     async def update_last_login(self, user_id: str) -> None:
         """Update the last login timestamp for a user"""
-        update_data = {"last_login": datetime.now(timezone.utc)}
-        await self.user_repo.update_user(user_id, update_data)
\ No newline at end of file
+        await self.user_repo.set_last_login(user_id, datetime.now(timezone.utc))
\ No newline at end of file
@@ -67,33 +67,28 @@ class CommentService:
                 # It's already an ID
                 article_id = article_id_or_slug
             
-            # Get the comment 
-            comment_db = await self.comment_repo.get_comment_by_id(comment_id)
-           
-            if not comment_db:
-                raise ValueError("Comment not found")
-                        
-            # Check if user is comment author or admin
-            if str(comment_db.get("user_id")) != str(current_user.id) and current_user.user_type != "admin":
-                raise PermissionError("Not enough permissions")
-
             # Update data
             update_data = {
                 "text": text,
                 "updated_at": datetime.now(timezone.utc)
             }
             
-            # Call repository to update comment
-            updated_comment = await self.comment_repo.update_comment(comment_id, update_data)
+            # Call repository to update comment, admins may update any comment,
+            # everyone else only their own which the update itself checks
+            owner_id = None if current_user.user_type == "admin" else ObjectId(current_user.id)
+            updated_comment = await self.comment_repo.update_comment(comment_id, update_data, owner_id)
             if not updated_comment:
-                raise ValueError("Failed to update comment")
+                # Only a failed update needs to tell a missing comment from someone else's
+                if owner_id is not None and await self.comment_repo.get_comment_by_id(comment_id):
+                    raise PermissionError("Not enough permissions")
+                raise ValueError("Comment not found")
             
             response_data = {
             "id": updated_comment.get("_id"),
             "parent_comment_id": updated_comment["parent_comment_id"],
             "text": updated_comment.get("text"),
             "article_id": article_id,
-            "user_id": str(current_user.id),
+            "user_id": current_user.id_str,
             "username": current_user.username,
             "user_first_name": current_user.first_name,
             "user_last_name": current_user.last_name,
@@ -118,20 +113,15 @@ class CommentService:
                 if not article:
                     raise ValueError("Article not found")
             
-            # Get the comment
-            comment_db = await self.comment_repo.get_comment_by_id(comment_id)
-            if not comment_db:
+            # Call repository to delete the comment, admins may delete any comment,
+            # everyone else only their own which the delete itself checks
+            owner_id = None if current_user.user_type == "admin" else ObjectId(current_user.id)
+            deleted_comment = await self.comment_repo.soft_delete_comment(comment_id, owner_id)
+            if not deleted_comment:
+                # Only a failed delete needs to tell a missing comment from someone else's
+                if owner_id is not None and await self.comment_repo.get_comment_by_id(comment_id):
+                    raise PermissionError("Not enough permissions")
                 raise ValueError("Comment not found")
-
-            
-            # Check if user is comment author or admin
-            if str(comment_db.get("user_id")) != str(current_user.id) and current_user.user_type != "admin":
-                raise PermissionError("Not enough permissions")
-            
-            # Call repository to delete the comment
-            success = await self.comment_repo.soft_delete_comment(comment_id)
-            if not success:
-                raise ValueError("Failed to delete comment")
                 
             return True
         except Exception as e:
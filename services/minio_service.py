@@ -1,11 +1,14 @@
 # app/services/minio_service.py
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, BinaryIO, Dict, Optional, Tuple, Union
 from fastapi import UploadFile, HTTPException, status
 from minio import Minio
+from minio.error import S3Error
+import asyncio
 import io
 import uuid
 from datetime import datetime, timezone, timedelta
 import base64
+import hashlib
 import re
 from db.db import get_db
 from config import settings
@@ -16,6 +19,9 @@ import unicodedata
 # Global minio client - will be initialized by get_object_storage
 minio_client = None
 
+# Part size used when streaming file objects to MinIO
+UPLOAD_PART_SIZE = 5 * 1024 * 1024
+
 async def generate_unique_file_id(mongo_collection) -> str:
     """
     Generate a unique file ID and verify it doesn't exist in the database
@@ -27,12 +33,103 @@ async def generate_unique_file_id(mongo_collection) -> str:
         if not existing_file:
             return file_id
 
-async def process_image(image_data: bytes, max_size: Tuple[int, int] = (1920, 1080), quality: int = 85) -> Tuple[bytes, str]:
+def object_exists(minio_client: Minio, bucket_name: str, object_name: str) -> bool:
+    """
+    Check whether an object is already stored in the bucket
+    """
+    try:
+        minio_client.stat_object(bucket_name, object_name)
+        return True
+    except S3Error as e:
+        if e.code in ("NoSuchKey", "NoSuchObject"):
+            return False
+        raise
+
+def hash_stream(stream: BinaryIO) -> Tuple[str, int]:
+    """
+    Compute the SHA-256 and size of a seekable stream, leaving it rewound
+    Returns a tuple of (hex_digest, size_in_bytes)
+    """
+    stream.seek(0)
+    digest = hashlib.file_digest(stream, "sha256").hexdigest()
+    size = stream.tell()
+    stream.seek(0)
+    return digest, size
+
+def presigned_download_url(minio_client: Minio, bucket_name: str, object_name: str) -> str:
+    """
+    Generate a pre-signed URL for reading an object, valid for one hour
+    """
+    return minio_client.presigned_get_object(
+        bucket_name=bucket_name,
+        object_name=object_name,
+        expires=timedelta(hours=1)
+    )
+
+def put_object_if_missing(minio_client: Minio, bucket_name: str, object_name: str, stream: BinaryIO, length: int, content_type: str) -> Tuple[bool, str]:
+    """
+    Upload a stream unless an object with the same name already exists
+    The stream is sent in UPLOAD_PART_SIZE chunks, so it is never fully held in memory
+    All of the blocking SDK work for one upload happens here so it costs a single thread hop
+    Returns a tuple of (uploaded, presigned_download_url)
+    """
+    uploaded = False
+    if not object_exists(minio_client, bucket_name, object_name):
+        minio_client.put_object(
+            bucket_name=bucket_name,
+            object_name=object_name,
+            data=stream,
+            length=length,
+            content_type=content_type,
+            part_size=UPLOAD_PART_SIZE
+        )
+        uploaded = True
+    return uploaded, presigned_download_url(minio_client, bucket_name, object_name)
+
+def stat_object_with_url(minio_client: Minio, bucket_name: str, object_name: str) -> Tuple[Any, str]:
+    """
+    Read an object's metadata and a pre-signed URL for it in one blocking call
+    Returns a tuple of (stat, presigned_download_url)
+    """
+    stat = minio_client.stat_object(bucket_name, object_name)
+    return stat, presigned_download_url(minio_client, bucket_name, object_name)
+
+def convert_image_to_webp(image_data: Union[bytes, BinaryIO], max_size: Tuple[int, int], quality: int) -> bytes:
+    """
+    Decode, resize and re-encode an image as WebP
+    This is CPU-bound and blocking, so callers should run it in a worker thread
+    """
+    # Open image from bytes or straight from the uploaded file
+    image = Image.open(io.BytesIO(image_data) if isinstance(image_data, bytes) else image_data)
+    print(f"[Image Processing] Original image size: {image.size}, mode: {image.mode}")
+    
+    # Convert to RGB if necessary (for PNG with transparency)
+    if image.mode in ('RGBA', 'LA'):
+        print(f"[Image Processing] Converting from {image.mode} to RGB with white background")
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.split()[-1])
+        image = background
+    elif image.mode != 'RGB':
+        print(f"[Image Processing] Converting from {image.mode} to RGB")
+        image = image.convert('RGB')
+    
+    # Resize if larger than max_size while maintaining aspect ratio
+    if image.size[0] > max_size[0] or image.size[1] > max_size[1]:
+        print(f"[Image Processing] Resizing image from {image.size} to max {max_size}")
+        image.thumbnail(max_size, Image.Resampling.LANCZOS)
+    
+    # Save as WebP
+    print(f"[Image Processing] Converting to WebP format with quality {quality}")
+    output = io.BytesIO()
+    image.save(output, format='WEBP', quality=quality, optimize=True)
+    return output.getvalue()
+
+async def process_image(image_data: Union[bytes, BinaryIO], max_size: Tuple[int, int] = (1920, 1080), quality: int = 85) -> Tuple[bytes, str]:
     """
     Process and compress an image, converting it to WebP format
     
     Args:
-        image_data: Raw image data in bytes
+        image_data: Raw image data as bytes or a seekable file object
         max_size: Maximum dimensions (width, height)
         quality: Compression quality (1-100)
     
@@ -41,30 +138,7 @@ async def process_image(image_data: bytes, max_size: Tuple[int, int] = (1920, 10
     """
     try:
         print(f"[Image Processing] Starting image processing...")
-        # Open image from bytes
-        image = Image.open(io.BytesIO(image_data))
-        print(f"[Image Processing] Original image size: {image.size}, mode: {image.mode}")
-        
-        # Convert to RGB if necessary (for PNG with transparency)
-        if image.mode in ('RGBA', 'LA'):
-            print(f"[Image Processing] Converting from {image.mode} to RGB with white background")
-            background = Image.new('RGB', image.size, (255, 255, 255))
-            background.paste(image, mask=image.split()[-1])
-            image = background
-        elif image.mode != 'RGB':
-            print(f"[Image Processing] Converting from {image.mode} to RGB")
-            image = image.convert('RGB')
-        
-        # Resize if larger than max_size while maintaining aspect ratio
-        if image.size[0] > max_size[0] or image.size[1] > max_size[1]:
-            print(f"[Image Processing] Resizing image from {image.size} to max {max_size}")
-            image.thumbnail(max_size, Image.Resampling.LANCZOS)
-        
-        # Save as WebP
-        print(f"[Image Processing] Converting to WebP format with quality {quality}")
-        output = io.BytesIO()
-        image.save(output, format='WEBP', quality=quality, optimize=True)
-        processed_data = output.getvalue()
+        processed_data = await asyncio.to_thread(convert_image_to_webp, image_data, max_size, quality)
         print(f"[Image Processing] Successfully converted to WebP. New size: {len(processed_data)} bytes")
         
         return processed_data, 'image/webp'
@@ -77,7 +151,7 @@ async def process_image(image_data: bytes, max_size: Tuple[int, int] = (1920, 10
         )
 
 async def upload_to_minio(
-    data: bytes, 
+    data: Union[bytes, BinaryIO], 
     filename: str, 
     content_type: str, 
     minio_client: Minio,
@@ -87,7 +161,8 @@ async def upload_to_minio(
     Common function to upload any data to MinIO
     
     Args:
-        data: The file content as bytes
+        data: The file content as bytes, or a seekable file object (e.g. UploadFile.file)
+              which is streamed to MinIO instead of being read into memory
         filename: Original filename or generated name
         content_type: MIME type of the file
         minio_client: MinIO client instance
@@ -99,10 +174,21 @@ async def upload_to_minio(
     try:
         print(f"[MinIO Upload] Starting upload process for file: {filename}")
         print(f"[MinIO Upload] Content type: {content_type}")
-        print(f"[MinIO Upload] Original file size: {len(data)} bytes")
         
         # Process image if it's an image file
+        source_hash = None
         if content_type.startswith('image/'):
+            # The same source image converts to the same WebP object, so an image this
+            # folder already holds is reused without converting or uploading it again
+            if isinstance(data, bytes):
+                source_hash = hashlib.sha256(data).hexdigest()
+            else:
+                source_hash, _ = await asyncio.to_thread(hash_stream, data)
+            stored = await find_stored_image(source_hash, folder)
+            if stored:
+                print(f"[MinIO Upload] Identical image already stored as {stored['object_name']}, skipping upload")
+                return await reuse_stored_image(stored, filename, minio_client)
+            
             print(f"[MinIO Upload] Detected image file, proceeding with image processing")
             processed_data, content_type = await process_image(data)
             data = processed_data
@@ -117,30 +203,30 @@ async def upload_to_minio(
         file_extension = filename.split('.')[-1].lower()
         print(f"[MinIO Upload] Generated file_id: {file_id}")
         
+        # Name the object after its content so identical uploads share one object
+        if isinstance(data, bytes):
+            content_hash = hashlib.sha256(data).hexdigest()
+            file_size = len(data)
+            stream = io.BytesIO(data)
+        else:
+            content_hash, file_size = await asyncio.to_thread(hash_stream, data)
+            stream = data
+        
         # Setup bucket info
         bucket_name = settings.MINIO_BUCKET
-        object_name = f"{folder}/{file_id}.{file_extension}"
+        object_name = f"{folder}/{content_hash}.{file_extension}"
         print(f"[MinIO Upload] Will upload to bucket: {bucket_name}, object: {object_name}")
         
-        # Upload to MinIO
-        file_size = len(data)
+        # Upload to MinIO unless the same content is already stored. The minio SDK
+        # is blocking, so the network calls run in a worker thread
         print(f"[MinIO Upload] Uploading file of size: {file_size} bytes")
-        minio_client.put_object(
-            bucket_name=bucket_name,
-            object_name=object_name,
-            data=io.BytesIO(data),
-            length=file_size,
-            content_type=content_type
-        )
-        print(f"[MinIO Upload] Successfully uploaded to MinIO")
-        
-        # Generate pre-signed URL for accessing the file
-        url = minio_client.presigned_get_object(
-            bucket_name=bucket_name,
-            object_name=object_name,
-            expires=timedelta(hours=1)
+        uploaded, url = await asyncio.to_thread(
+            put_object_if_missing, minio_client, bucket_name, object_name, stream, file_size, content_type
         )
-        print(f"[MinIO Upload] Generated pre-signed URL")
+        if uploaded:
+            print(f"[MinIO Upload] Successfully uploaded to MinIO")
+        else:
+            print(f"[MinIO Upload] Object already exists, skipping upload")
         
         # Create a base slug from the filename
         base_slug = await create_slug(os.path.splitext(filename)[0])
@@ -157,10 +243,13 @@ async def upload_to_minio(
             "file_extension": file_extension,
             "size": file_size,
             "object_name": object_name,
+            "content_hash": content_hash,
             "url": url,
             "slug": base_slug,
             "unique_string": unique_string,
-            "uploaded_at": datetime.now(timezone.utc)
+            "uploaded_at": datetime.now(timezone.utc),
+            "folder": folder,
+            "source_hash": source_hash
         }
         
     except Exception as e:
@@ -171,6 +260,115 @@ async def upload_to_minio(
         )
 
 
+async def find_stored_image(source_hash: str, folder: str) -> Optional[Dict[str, Any]]:
+    """
+    Find the metadata of an image converted from the same source bytes into the same folder
+    """
+    db = await get_db()
+    return await db.files.find_one(
+        {"source_hash": source_hash, "folder": folder},
+        {
+            "_id": 0, "file_type": 1, "file_extension": 1, "size": 1,
+            "object_name": 1, "content_hash": 1, "folder": 1, "source_hash": 1
+        }
+    )
+
+async def reuse_stored_image(stored: Dict[str, Any], filename: str, minio_client: Minio) -> Dict[str, Any]:
+    """
+    Build upload_to_minio's result for an image whose converted object is already in the bucket
+    The caller still gets a new file_id, so the new metadata document is independent of the old one
+    """
+    file_id = str(uuid.uuid4())
+    filename = os.path.splitext(filename)[0] + '.' + stored["file_extension"]
+    url = await asyncio.to_thread(presigned_download_url, minio_client, settings.MINIO_BUCKET, stored["object_name"])
+    return {
+        **stored,
+        "file_id": file_id,
+        "filename": filename,
+        "url": url,
+        "slug": await create_slug(os.path.splitext(filename)[0]),
+        "unique_string": file_id[:8],
+        "uploaded_at": datetime.now(timezone.utc)
+    }
+
+async def create_presigned_upload(
+    minio_client: Minio,
+    filename: str,
+    folder: str,
+    expires: timedelta = timedelta(minutes=15)
+) -> Dict[str, Any]:
+    """
+    Reserve an object name and a presigned PUT URL so a client can upload
+    a file straight to MinIO without passing the bytes through the API
+    
+    Returns:
+        Dict with the file_id, object_name and upload URL
+    """
+    try:
+        file_id = str(uuid.uuid4())
+        file_extension = filename.split('.')[-1].lower() if '.' in filename else 'bin'
+        object_name = f"{folder}/{file_id}.{file_extension}"
+        
+        url = await asyncio.to_thread(
+            minio_client.presigned_put_object,
+            settings.MINIO_BUCKET,
+            object_name,
+            expires
+        )
+        
+        return {
+            "file_id": file_id,
+            "object_name": object_name,
+            "url": url,
+            "expires_in": int(expires.total_seconds())
+        }
+        
+    except Exception as e:
+        print(f"[MinIO Presign] Error creating upload URL: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to create upload URL: {str(e)}"
+        )
+
+
+async def describe_uploaded_object(
+    minio_client: Minio,
+    file_id: str,
+    object_name: str,
+    filename: str
+) -> Dict[str, Any]:
+    """
+    Build the file metadata for an object a client uploaded through a presigned URL
+    The size and content type are read back from MinIO rather than trusted from the client
+    
+    Returns:
+        Dict with the same file metadata fields as upload_to_minio
+    """
+    bucket_name = settings.MINIO_BUCKET
+    try:
+        stat, url = await asyncio.to_thread(stat_object_with_url, minio_client, bucket_name, object_name)
+    except S3Error as e:
+        if e.code in ("NoSuchKey", "NoSuchObject"):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Uploaded file not found"
+            )
+        raise
+    
+    return {
+        "file_id": file_id,
+        "filename": filename,
+        "file_type": stat.content_type,
+        "file_extension": object_name.split('.')[-1].lower(),
+        "size": stat.size,
+        "object_name": object_name,
+        "url": url,
+        "slug": await create_slug(os.path.splitext(filename)[0]),
+        "unique_string": file_id[:8],
+        "uploaded_at": datetime.now(timezone.utc)
+    }
+
+
 async def upload_profile_picture(profile_picture: UploadFile, username: str, minio_client: Minio) -> Dict[str, Any]:
     """
     Upload a profile picture to MinIO and create a file record
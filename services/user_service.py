@@ -15,6 +15,11 @@ from models.users_model import UserCreate, UserUpdate
 from db.schemas.users_schema import UserInDB
 from repos.user_repo import UserRepository
 from config import settings
+from utils.cache import TTLCache
+
+# Followed user ObjectIds keyed by user id, used by the following feed.
+# Entries are dropped on follow/unfollow and otherwise expire after a minute
+following_ids_cache = TTLCache(maxsize=10000, ttl=60)
 
 class UserService:
     """
@@ -207,19 +212,30 @@ class UserService:
         Follow an author by username or ID
         Returns status message
         """
-        return await self.user_repo.follow_author(user_id, author_identifier)
+        result = await self.user_repo.follow_author(user_id, author_identifier)
+        following_ids_cache.invalidate(str(user_id))
+        return result
     
     async def unfollow_author(self, user_id: str, author_identifier: str) -> Dict[str, str]:
         """
         Unfollow an author by username or ID
         Returns status message
         """
-        return await self.user_repo.unfollow_author(user_id, author_identifier)
+        result = await self.user_repo.unfollow_author(user_id, author_identifier)
+        following_ids_cache.invalidate(str(user_id))
+        return result
     
     async def get_following(self, current_user: UserInDB) -> List[Dict[str, Any]]:
         """Get list of users that the current user follows"""
         return await self.user_repo.get_following(current_user)
     
+    async def get_following_ids(self, user_id: str) -> List[Any]:
+        """Get the ObjectIds of the users that a user follows, cached for a short time"""
+        user_id = str(user_id)
+        return await following_ids_cache.get_or_set(
+            user_id, lambda: self.user_repo.get_following_ids(user_id)
+        )
+    
     async def get_user_statistics(self, user_identifier: str, current_user: Optional[UserInDB]) -> Dict[str, Any]:
         """Get comprehensive statistics for a user"""
         return await self.user_repo.get_user_statistics(user_identifier, current_user)
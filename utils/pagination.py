@@ -0,0 +1,25 @@
+from datetime import datetime
+from typing import Any, Dict, Tuple
+
+from bson import ObjectId
+
+def parse_cursor(after: str) -> Tuple[datetime, ObjectId]:
+    """
+    Parse an "<created_at>,<id>" keyset cursor, as taken from the last item of the previous page
+    Raises ValueError if the cursor is malformed
+    """
+    created_at, _, object_id = after.rpartition(",")
+    if not created_at or not ObjectId.is_valid(object_id):
+        raise ValueError(f"Invalid cursor: {after}")
+    return datetime.fromisoformat(created_at.replace("Z", "+00:00")), ObjectId(object_id)
+
+def keyset_filter(created_at: datetime, object_id: ObjectId) -> Dict[str, Any]:
+    """
+    Build a filter matching documents that come after the cursor when sorted by (created_at, _id) descending
+    """
+    return {
+        "$or": [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "_id": {"$lt": object_id}}
+        ]
+    }
@@ -0,0 +1,25 @@
+from typing import Any
+
+import orjson
+from bson import ObjectId
+from fastapi.responses import ORJSONResponse
+
+def _default(obj: Any) -> Any:
+    """Fallback for types orjson does not serialize natively"""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def dumps(obj: Any, option: int = 0) -> bytes:
+    """
+    Serialize a Mongo document to JSON bytes without walking it in Python first.
+    Datetimes are written by orjson in the same ISO 8601 form as clean_document,
+    and ObjectIds fall back to their string form. Extra orjson options can be passed in option
+    """
+    return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS | option)
+
+class MongoJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also accepts ObjectId values"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)